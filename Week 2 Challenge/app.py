@@ -3,28 +3,20 @@
 """Streamlit Web Interface for Meeting Action Items Extractor"""
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from dataclasses import astuple, fields
 from datetime import datetime
+import io
 from io import StringIO
 import sys
 
 from src.parser import TranscriptParser
-from src.action_detector import ActionDetector
+from src.action_detector import ActionDetector, ActionItem
 from src.summary_generator import SummaryGenerator
 from src.exceptions import MeetingExtractorError
 
 
-# Page configuration
-st.set_page_config(
-    page_title="Meeting Action Items Extractor",
-    page_icon="📋",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS for better styling
-st.markdown("""
+# Static page content (built once at import, reused on every rerun)
+_PAGE_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -67,7 +59,108 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_SIDEBAR_FORMATS_MD = """
+**Zoom:**
+```
+00:00:15 Sarah Chen: Good morning everyone!
+```
+
+**Google Meet:**
+```
+10:00 AM Jennifer Lee: Hi team, welcome!
+```
+
+**Plain Text:**
+```
+Lisa Thompson: Welcome everyone!
+```
+"""
+
+_SIDEBAR_TIPS_MD = """
+### 💡 Tips
+- Upload a .txt file with your transcript
+- Action items are detected using keywords like "will", "should", "need to"
+- Deadlines are parsed from phrases like "by Friday", "in 2 days"
+"""
+
+_PRIO_EMOJI = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+
+
+# Page configuration
+st.set_page_config(
+    page_title="Meeting Action Items Extractor",
+    page_icon="📋",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling
+st.markdown(_PAGE_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_parser():
+    """Shared TranscriptParser instance (persists across reruns)"""
+    return TranscriptParser()
+
+
+@st.cache_resource
+def get_detector():
+    """Shared ActionDetector instance (persists across reruns)"""
+    return ActionDetector()
+
+
+@st.cache_resource
+def get_generator():
+    """Shared SummaryGenerator instance (persists across reruns)"""
+    return SummaryGenerator()
+
+
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def _parse_cached(content):
+    """Parse transcript content (memoized on the raw text)"""
+    return get_parser().parse(content)
+
+
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def _extract_cached(content):
+    """Parse and extract action items (memoized on the raw text)"""
+    messages = _parse_cached(content)
+    return messages, get_detector().extract_action_items(messages)
+
+
+def _items_frame(action_items):
+    """Columnar view of action items used by the analytic views"""
+    columns = [f.name for f in fields(ActionItem)]
+    frame = pd.DataFrame(
+        {name: [getattr(item, name) for item in action_items] for name in columns},
+        columns=columns
+    )
+    
+    # Empty strings mean "not set", like None, so notna()/fillna() below
+    # treat them the same way the item-level truthiness checks did
+    for name in ('assignee', 'deadline', 'timestamp'):
+        frame[name] = frame[name].replace('', None)
+    return frame
+
+
+def _session_items_df():
+    """Action-item frame for the current session (rebuilt if missing)"""
+    if 'items_df' not in st.session_state:
+        st.session_state['items_df'] = _items_frame(st.session_state['action_items'])
+    return st.session_state['items_df']
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _preview_frame(preview_messages):
+    """Transcript preview table for the first few messages (memoized)"""
+    columns = ['timestamp', 'speaker', 'text']
+    return pd.DataFrame(
+        {name: [msg.get(name, '') for msg in preview_messages] for name in columns},
+        columns=columns
+    )
 
 
 def main():
@@ -93,52 +186,20 @@ def main():
             help="Date of the meeting"
         )
         
-        include_stats = st.checkbox(
-            "Include Statistics",
-            value=True,
-            help="Include statistics in the summary"
-        )
-        
-        include_context = st.checkbox(
-            "Include Context",
-            value=False,
-            help="Include surrounding context for each action item"
-        )
-        
         st.divider()
         
         st.header("📚 Supported Formats")
-        st.markdown("""
-        **Zoom:**
-        ```
-        00:00:15 Sarah Chen: Good morning everyone!
-        ```
-        
-        **Google Meet:**
-        ```
-        10:00 AM Jennifer Lee: Hi team, welcome!
-        ```
-        
-        **Plain Text:**
-        ```
-        Lisa Thompson: Welcome everyone!
-        ```
-        """)
+        st.markdown(_SIDEBAR_FORMATS_MD)
         
         st.divider()
         
-        st.markdown("""
-        ### 💡 Tips
-        - Upload a .txt file with your transcript
-        - Action items are detected using keywords like "will", "should", "need to"
-        - Deadlines are parsed from phrases like "by Friday", "in 2 days"
-        """)
+        st.markdown(_SIDEBAR_TIPS_MD)
     
     # Main content
     tab1, tab2, tab3 = st.tabs(["📤 Upload & Extract", "📊 Dashboard", "📥 Download"])
     
     with tab1:
-        upload_and_extract(meeting_title, meeting_date, include_stats, include_context)
+        upload_and_extract(meeting_title, meeting_date)
     
     with tab2:
         show_dashboard()
@@ -147,7 +208,7 @@ def main():
         show_downloads()
 
 
-def upload_and_extract(meeting_title, meeting_date, include_stats, include_context):
+def upload_and_extract(meeting_title, meeting_date):
     """Upload and extract action items"""
     
     st.header("Upload Transcript")
@@ -174,7 +235,11 @@ def upload_and_extract(meeting_title, meeting_date, include_stats, include_conte
         # Get content
         content = None
         if uploaded_file:
-            content = uploaded_file.read().decode('utf-8')
+            # Decode through a text wrapper instead of copying the whole
+            # payload to bytes first; detach so the upload buffer stays open
+            reader = io.TextIOWrapper(uploaded_file, encoding='utf-8', newline='')
+            content = reader.read()
+            reader.detach()
         elif transcript_text:
             content = transcript_text
         else:
@@ -184,20 +249,14 @@ def upload_and_extract(meeting_title, meeting_date, include_stats, include_conte
         # Process transcript
         with st.spinner("Processing transcript..."):
             try:
-                # Parse
-                parser = TranscriptParser()
-                messages = parser.parse(content)
+                # Parse and extract (cached per transcript content)
+                messages, action_items = _extract_cached(content)
                 
                 st.success(f"✅ Parsed {len(messages)} messages")
                 
                 # Show preview
                 with st.expander("📝 Transcript Preview", expanded=False):
-                    preview_df = pd.DataFrame(messages[:10])
-                    st.dataframe(preview_df, use_container_width=True)
-                
-                # Extract action items
-                detector = ActionDetector()
-                action_items = detector.extract_action_items(messages)
+                    st.dataframe(_preview_frame(messages[:10]), use_container_width=True)
                 
                 if not action_items:
                     st.warning("⚠️ No action items detected in transcript")
@@ -211,16 +270,16 @@ def upload_and_extract(meeting_title, meeting_date, include_stats, include_conte
                 
                 st.success(f"✅ Found {len(action_items)} action items")
                 
-                # Store in session state
+                # Store in session state (list for SummaryGenerator, frame for analytics)
+                items_df = _items_frame(action_items)
                 st.session_state['action_items'] = action_items
+                st.session_state['items_df'] = items_df
                 st.session_state['messages'] = messages
                 st.session_state['meeting_title'] = meeting_title
                 st.session_state['meeting_date'] = meeting_date.strftime('%B %d, %Y')
-                st.session_state['include_stats'] = include_stats
-                st.session_state['include_context'] = include_context
                 
                 # Display action items
-                display_action_items(action_items)
+                display_action_items(items_df)
                 
             except MeetingExtractorError as e:
                 st.error(f"❌ {e.message}")
@@ -232,26 +291,26 @@ def upload_and_extract(meeting_title, meeting_date, include_stats, include_conte
                 st.exception(e)
 
 
-def display_action_items(action_items):
+def _truncate(series, width):
+    """Cut strings longer than width and mark them with an ellipsis"""
+    return series.mask(series.str.len() > width, series.str.slice(0, width) + '...')
+
+
+def display_action_items(items_df):
     """Display action items in a table"""
     
     st.header("📋 Extracted Action Items")
     
-    # Convert to DataFrame
-    items_data = []
-    for item in action_items:
-        priority_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}.get(item.priority, '⚪')
-        
-        items_data.append({
-            'Priority': f"{priority_emoji} {item.priority.capitalize()}",
-            'Task': item.task[:100] + '...' if len(item.task) > 100 else item.task,
-            'Assignee': item.assignee or 'Unassigned',
-            'Deadline': item.deadline or 'No deadline',
-            'Speaker': item.speaker,
-            'Time': item.timestamp or '-'
-        })
-    
-    df = pd.DataFrame(items_data)
+    # Convert to DataFrame (one list per column)
+    priorities = items_df['priority']
+    df = pd.DataFrame({
+        'Priority': priorities.map(_PRIO_EMOJI).fillna('⚪') + ' ' + priorities.str.capitalize(),
+        'Task': _truncate(items_df['task'], 100),
+        'Assignee': items_df['assignee'].fillna('Unassigned'),
+        'Deadline': items_df['deadline'].fillna('No deadline'),
+        'Speaker': items_df['speaker'],
+        'Time': items_df['timestamp'].fillna('-')
+    }, copy=False)
     
     # Display with styling
     st.dataframe(
@@ -269,6 +328,84 @@ def display_action_items(action_items):
     )
 
 
+@st.cache_data(show_spinner=False)
+def _priority_fig(counts):
+    """Build the priority pie chart from ((label, count), ...)"""
+    import plotly.express as px  # deferred: only the Dashboard tab needs plotly
+    
+    fig = px.pie(
+        values=[count for _, count in counts],
+        names=[name for name, _ in counts],
+        color=[name for name, _ in counts],
+        color_discrete_map={'High': '#e74c3c', 'Medium': '#f39c12', 'Low': '#2ecc71'},
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(showlegend=False, height=300)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _assignee_fig(sorted_assignees):
+    """Build the assignee bar chart from ((name, count), ...) sorted by count"""
+    import plotly.express as px
+    
+    names, counts = zip(*sorted_assignees) if sorted_assignees else ((), ())
+    counts = list(counts)
+    fig = px.bar(
+        x=counts,
+        y=list(names),
+        orientation='h',
+        color=counts,
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(
+        showlegend=False,
+        xaxis_title="Number of Tasks",
+        yaxis_title="Assignee",
+        height=300,
+        coloraxis_showscale=False
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _timeline_fig(rows):
+    """Build the deadline timeline from ((task, deadline, assignee, priority), ...)"""
+    import plotly.express as px
+    
+    tasks, deadlines, assignees, priorities = zip(*rows)
+    df_timeline = pd.DataFrame({
+        'Task': _truncate(pd.Series(tasks), 50),
+        'Deadline': list(deadlines),
+        'Assignee': [a or 'Unassigned' for a in assignees],
+        'Priority': list(priorities)
+    }, copy=False)
+    
+    # Try to parse dates for sorting (each distinct deadline string once)
+    try:
+        unique_deadlines = df_timeline['Deadline'].unique()
+        parsed = pd.to_datetime(pd.Series(unique_deadlines), errors='coerce')
+        df_timeline['Deadline_Sort'] = df_timeline['Deadline'].map(dict(zip(unique_deadlines, parsed)))
+        df_timeline = df_timeline.sort_values('Deadline_Sort')
+    except:
+        pass
+    
+    fig = px.scatter(
+        df_timeline,
+        x='Deadline',
+        y='Task',
+        color='Priority',
+        color_discrete_map={'high': '#e74c3c', 'medium': '#f39c12', 'low': '#2ecc71'},
+        hover_data=['Assignee'],
+        size_max=15
+    )
+    fig.update_traces(marker=dict(size=12))
+    fig.update_layout(height=400, showlegend=True)
+    return fig
+
+
+@st.fragment
 def show_dashboard():
     """Show statistics dashboard"""
     
@@ -278,25 +415,32 @@ def show_dashboard():
         st.info("👆 Upload and extract action items first to see statistics")
         return
     
-    action_items = st.session_state['action_items']
+    df = _session_items_df()
     
-    if not action_items:
+    if df.empty:
         st.warning("No action items to display")
         return
     
+    # Derive all counters from the columnar frame
+    total = len(df)
+    assigned = int(df['assignee'].notna().sum())
+    with_deadline = int(df['deadline'].notna().sum())
+    priority_counts = df['priority'].value_counts()
+    assignee_counts = df['assignee'].fillna('Unassigned').value_counts()
+    high_priority = int(priority_counts.get('high', 0))
+    
     # Summary statistics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown(f"""
         <div class="stat-card">
-            <div class="stat-value">{len(action_items)}</div>
+            <div class="stat-value">{total}</div>
             <div class="stat-label">Total Items</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        assigned = len([i for i in action_items if i.assignee])
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-value">{assigned}</div>
@@ -305,7 +449,6 @@ def show_dashboard():
         """, unsafe_allow_html=True)
     
     with col3:
-        with_deadline = len([i for i in action_items if i.deadline])
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-value">{with_deadline}</div>
@@ -314,7 +457,6 @@ def show_dashboard():
         """, unsafe_allow_html=True)
     
     with col4:
-        high_priority = len([i for i in action_items if i.priority == 'high'])
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-value" style="color: #e74c3c;">{high_priority}</div>
@@ -329,90 +471,85 @@ def show_dashboard():
     
     with col1:
         st.subheader("📊 Priority Distribution")
-        priority_counts = {
-            'High': len([i for i in action_items if i.priority == 'high']),
-            'Medium': len([i for i in action_items if i.priority == 'medium']),
-            'Low': len([i for i in action_items if i.priority == 'low'])
-        }
-        
-        fig_priority = px.pie(
-            values=list(priority_counts.values()),
-            names=list(priority_counts.keys()),
-            color=list(priority_counts.keys()),
-            color_discrete_map={'High': '#e74c3c', 'Medium': '#f39c12', 'Low': '#2ecc71'},
-            hole=0.4
+        pie_counts = (
+            ('High', high_priority),
+            ('Medium', int(priority_counts.get('medium', 0))),
+            ('Low', int(priority_counts.get('low', 0)))
         )
-        fig_priority.update_traces(textposition='inside', textinfo='percent+label')
-        fig_priority.update_layout(showlegend=False, height=300)
-        st.plotly_chart(fig_priority, use_container_width=True)
+        st.plotly_chart(_priority_fig(pie_counts), use_container_width=True)
     
     with col2:
         st.subheader("👥 Assignee Breakdown")
-        assignee_counts = {}
-        for item in action_items:
-            assignee = item.assignee or 'Unassigned'
-            assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
-        
-        # Sort by count
-        sorted_assignees = sorted(assignee_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        fig_assignee = px.bar(
-            x=[count for _, count in sorted_assignees],
-            y=[name for name, _ in sorted_assignees],
-            orientation='h',
-            color=[count for _, count in sorted_assignees],
-            color_continuous_scale='Blues'
-        )
-        fig_assignee.update_layout(
-            showlegend=False,
-            xaxis_title="Number of Tasks",
-            yaxis_title="Assignee",
-            height=300,
-            coloraxis_showscale=False
-        )
-        st.plotly_chart(fig_assignee, use_container_width=True)
+        # value_counts() is already sorted by count
+        sorted_assignees = tuple((name, int(count)) for name, count in assignee_counts.items())
+        st.plotly_chart(_assignee_fig(sorted_assignees), use_container_width=True)
     
     # Timeline
     st.subheader("📅 Timeline View")
     
-    items_with_deadlines = [i for i in action_items if i.deadline]
-    
-    if items_with_deadlines:
-        timeline_data = []
-        for item in items_with_deadlines:
-            timeline_data.append({
-                'Task': item.task[:50] + '...' if len(item.task) > 50 else item.task,
-                'Deadline': item.deadline,
-                'Assignee': item.assignee or 'Unassigned',
-                'Priority': item.priority
-            })
-        
-        df_timeline = pd.DataFrame(timeline_data)
-        
-        # Try to parse dates for sorting
-        try:
-            df_timeline['Deadline_Sort'] = pd.to_datetime(df_timeline['Deadline'], errors='coerce')
-            df_timeline = df_timeline.sort_values('Deadline_Sort')
-        except:
-            pass
-        
-        # Create timeline chart
-        fig_timeline = px.scatter(
-            df_timeline,
-            x='Deadline',
-            y='Task',
-            color='Priority',
-            color_discrete_map={'high': '#e74c3c', 'medium': '#f39c12', 'low': '#2ecc71'},
-            hover_data=['Assignee'],
-            size_max=15
-        )
-        fig_timeline.update_traces(marker=dict(size=12))
-        fig_timeline.update_layout(height=400, showlegend=True)
-        st.plotly_chart(fig_timeline, use_container_width=True)
+    with_dl = df[df['deadline'].notna()]
+    timeline_rows = tuple(zip(
+        with_dl['task'],
+        with_dl['deadline'],
+        with_dl['assignee'].fillna('Unassigned'),
+        with_dl['priority']
+    ))
+    
+    if timeline_rows:
+        st.plotly_chart(_timeline_fig(timeline_rows), use_container_width=True)
     else:
         st.info("No items with deadlines to display in timeline")
 
 
+def _items_key(action_items):
+    """Hashable snapshot of action items, usable as a cache key"""
+    return tuple(astuple(item) for item in action_items)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _markdown_summary(items_key, meeting_title, meeting_date, include_stats, include_context):
+    """Markdown summary for a snapshot of action items (memoized)"""
+    return get_generator().generate_markdown(
+        [ActionItem(*row) for row in items_key],
+        meeting_title=meeting_title,
+        meeting_date=meeting_date,
+        include_stats=include_stats,
+        include_context=include_context
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _json_summary(items_key, meeting_title, meeting_date, include_stats):
+    """JSON summary for a snapshot of action items (memoized)"""
+    return get_generator().generate_json(
+        [ActionItem(*row) for row in items_key],
+        meeting_title=meeting_title,
+        meeting_date=meeting_date,
+        include_stats=include_stats
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _markdown_bytes(items_key, meeting_title, meeting_date, include_stats, include_context):
+    """UTF-8 encoded Markdown summary for the download button (memoized)"""
+    return _markdown_summary(
+        items_key, meeting_title, meeting_date, include_stats, include_context
+    ).encode('utf-8')
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _json_bytes(items_key, meeting_title, meeting_date, include_stats):
+    """UTF-8 encoded JSON summary for the download button (memoized)"""
+    return _json_summary(items_key, meeting_title, meeting_date, include_stats).encode('utf-8')
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _compact_summary(items_key):
+    """One-line summary for a snapshot of action items (memoized)"""
+    return get_generator().generate_compact_summary([ActionItem(*row) for row in items_key])
+
+
+@st.fragment
 def show_downloads():
     """Show download options"""
     
@@ -425,10 +562,24 @@ def show_downloads():
     action_items = st.session_state['action_items']
     meeting_title = st.session_state.get('meeting_title', 'Meeting')
     meeting_date = st.session_state.get('meeting_date', datetime.now().strftime('%B %d, %Y'))
-    include_stats = st.session_state.get('include_stats', True)
-    include_context = st.session_state.get('include_context', False)
     
-    generator = SummaryGenerator()
+    # Summary options live inside this fragment so toggling them only
+    # regenerates the downloads, not the whole page
+    opt1, opt2 = st.columns(2)
+    with opt1:
+        include_stats = st.checkbox(
+            "Include Statistics",
+            value=True,
+            help="Include statistics in the summary"
+        )
+    with opt2:
+        include_context = st.checkbox(
+            "Include Context",
+            value=False,
+            help="Include surrounding context for each action item"
+        )
+    
+    items_key = _items_key(action_items)
     
     # Generate summaries
     col1, col2 = st.columns(2)
@@ -437,12 +588,8 @@ def show_downloads():
         st.subheader("📄 Markdown Format")
         
         try:
-            markdown = generator.generate_markdown(
-                action_items,
-                meeting_title=meeting_title,
-                meeting_date=meeting_date,
-                include_stats=include_stats,
-                include_context=include_context
+            markdown = _markdown_summary(
+                items_key, meeting_title, meeting_date, include_stats, include_context
             )
             
             # Preview
@@ -452,7 +599,9 @@ def show_downloads():
             # Download button
             st.download_button(
                 label="⬇️ Download Markdown",
-                data=markdown,
+                data=_markdown_bytes(
+                    items_key, meeting_title, meeting_date, include_stats, include_context
+                ),
                 file_name=f"{meeting_title.replace(' ', '_')}_summary.md",
                 mime="text/markdown",
                 use_container_width=True
@@ -465,12 +614,7 @@ def show_downloads():
         st.subheader("📊 JSON Format")
         
         try:
-            json_str = generator.generate_json(
-                action_items,
-                meeting_title=meeting_title,
-                meeting_date=meeting_date,
-                include_stats=include_stats
-            )
+            json_str = _json_summary(items_key, meeting_title, meeting_date, include_stats)
             
             # Preview
             with st.expander("Preview JSON", expanded=False):
@@ -479,7 +623,7 @@ def show_downloads():
             # Download button
             st.download_button(
                 label="⬇️ Download JSON",
-                data=json_str,
+                data=_json_bytes(items_key, meeting_title, meeting_date, include_stats),
                 file_name=f"{meeting_title.replace(' ', '_')}_summary.json",
                 mime="application/json",
                 use_container_width=True
@@ -492,32 +636,33 @@ def show_downloads():
     
     # Compact summary
     st.subheader("📋 Quick Summary")
-    compact = generator.generate_compact_summary(action_items)
+    compact = _compact_summary(items_key)
     st.info(compact)
     
     # Statistics table
     if action_items:
         st.subheader("📈 Detailed Statistics")
         
-        detector = ActionDetector()
-        stats = detector.get_statistics(action_items)
+        items_df = _session_items_df()
+        by_priority = items_df['priority'].value_counts()
+        with_deadline = int(items_df['deadline'].notna().sum())
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**Priority Breakdown**")
             priority_df = pd.DataFrame([
-                {'Priority': '🔴 High', 'Count': stats['by_priority']['high']},
-                {'Priority': '🟡 Medium', 'Count': stats['by_priority']['medium']},
-                {'Priority': '🟢 Low', 'Count': stats['by_priority']['low']}
+                {'Priority': '🔴 High', 'Count': int(by_priority.get('high', 0))},
+                {'Priority': '🟡 Medium', 'Count': int(by_priority.get('medium', 0))},
+                {'Priority': '🟢 Low', 'Count': int(by_priority.get('low', 0))}
             ])
             st.dataframe(priority_df, hide_index=True, use_container_width=True)
         
         with col2:
             st.markdown("**Deadline Status**")
             deadline_df = pd.DataFrame([
-                {'Status': '📅 With Deadline', 'Count': stats['with_deadline']},
-                {'Status': '⏰ No Deadline', 'Count': stats['without_deadline']}
+                {'Status': '📅 With Deadline', 'Count': with_deadline},
+                {'Status': '⏰ No Deadline', 'Count': len(items_df) - with_deadline}
             ])
             st.dataframe(deadline_df, hide_index=True, use_container_width=True)
 
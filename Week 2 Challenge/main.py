@@ -2,22 +2,32 @@
 # -*- coding: utf-8 -*-
 """Meeting Action Items Extractor CLI"""
 import click
-import yaml
+import copy
+import json
+import functools
 import logging
 import io
+import os
+import fnmatch
+import hashlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import sys
 from dotenv import load_dotenv
 
-# Fix Windows console encoding
+# Fix Windows console encoding (skip streams that are already UTF-8 so a
+# re-import does not stack another wrapper)
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    if (getattr(sys.stdout, 'encoding', None) or '').lower() != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
+    if (getattr(sys.stderr, 'encoding', None) or '').lower() != 'utf-8':
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', line_buffering=True)
 
 from src.parser import TranscriptParser
-from src.action_detector import ActionDetector
+from src.action_detector import ActionDetector, ActionItem
 from src.summary_generator import SummaryGenerator
 from src.email_sender import EmailSender, parse_email_list
 from src.exceptions import (
@@ -48,13 +58,30 @@ logger = logging.getLogger(__name__)
 
 
 # Load configuration
+@functools.lru_cache(maxsize=4)
+def _read_config(config_path: str) -> Optional[dict]:
+    """Parse a YAML config file once per process (None if it does not exist)"""
+    config_file = Path(config_path)
+    if not config_file.exists():
+        return None
+    
+    import yaml  # deferred: only needed when a config file exists
+    
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
 def load_config(config_path: str = 'config.yaml') -> dict:
-    """Load configuration from YAML file"""
+    """
+    Load configuration from YAML file
+    
+    The file is parsed once per process; every caller gets its own copy,
+    so changes made by one caller are not seen by the next.
+    """
     try:
-        config_file = Path(config_path)
-        if config_file.exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+        data = _read_config(config_path)
+        if data is not None:
+            return copy.deepcopy(data)
     except Exception as e:
         click.echo(click.style(f"⚠️  Warning: Could not load config: {e}", fg='yellow'))
     
@@ -203,7 +230,10 @@ def parse(
             click.echo("🎯 Extracting action items...", nl=False)
         
         detector = ActionDetector()
-        action_items = detector.extract_action_items(messages)
+        # Context is only rendered in JSON output and with --context
+        action_items = detector.extract_action_items(
+            messages, with_context=context or format in ('json', 'both')
+        )
         
         if not quiet:
             click.echo(click.style(f" ✓ Found {len(action_items)} action items", fg='green'))
@@ -235,18 +265,26 @@ def parse(
             else:
                 output = transcript_path.stem + '_summary.md'
         
+        # Markdown is shared by the markdown output and the email body,
+        # so generate it lazily and at most once
+        markdown = None
+        
+        def get_markdown() -> str:
+            nonlocal markdown
+            if markdown is None:
+                markdown = generator.generate_markdown(
+                    action_items,
+                    meeting_title=title,
+                    meeting_date=date,
+                    include_stats=include_stats,
+                    include_context=context
+                )
+            return markdown
+        
         # Generate and save
         if format == 'markdown' or format == 'both':
-            markdown = generator.generate_markdown(
-                action_items,
-                meeting_title=title,
-                meeting_date=date,
-                include_stats=include_stats,
-                include_context=context
-            )
-            
             md_output = output if format == 'markdown' else str(Path(output).with_suffix('.md'))
-            generator.save_to_file(markdown, md_output, 'markdown')
+            generator.save_to_file(get_markdown(), md_output, 'markdown')
             
             if not quiet:
                 click.echo(click.style(f" ✓", fg='green'))
@@ -277,9 +315,7 @@ def parse(
                 cc_recipients = parse_email_list(email_cc) if email_cc else None
                 
                 # Use markdown content for email
-                email_content = markdown if format != 'json' else generator.generate_markdown(
-                    action_items, title, date, include_stats, context
-                )
+                email_content = get_markdown()
                 
                 # Determine meeting date for email
                 email_date = date if date else datetime.now().strftime('%B %d, %Y')
@@ -386,13 +422,197 @@ def parse(
         logger.error(f"Unexpected error: {e}", exc_info=True)
         click.echo(click.style(f"\n❌ Unexpected Error: {e}", fg='red', bold=True), err=True)
         if not quiet:
-            import traceback
             click.echo("\n📋 Full error details:", err=True)
             click.echo(traceback.format_exc(), err=True)
         click.echo("\n💡 If this persists, check the log file: meeting_extractor.log", err=True)
         sys.exit(1)
 
 
+def _iter_matching(root: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """
+    Yield files under root whose names match pattern
+    
+    Same files and order as Path.glob / Path.rglob for a plain name pattern
+    (each directory's own matches first, then its subdirectories), but
+    driven by os.scandir so entries are not wrapped and stat'ed one by one.
+    Unreadable directories are skipped and symlinked directories are not
+    followed, as pathlib does. Patterns with a path part ('/' or '**') are
+    handed to pathlib, since fnmatch only sees the entry name.
+    """
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        matches = root.rglob(pattern) if recursive else root.glob(pattern)
+        yield from (path for path in matches if path.is_file())
+        return
+    
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirs.append(entry.path)
+            elif fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path)
+        except OSError:
+            continue
+    
+    for subdir in subdirs:
+        yield from _iter_matching(subdir, pattern, recursive)
+
+
+# Per-file extraction results for batch, one JSON file per transcript.
+# Entries are tied to the src/ sources, so editing the parser or detector
+# invalidates them; bump the version for format changes.
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'meeting_extractor'
+_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1)
+def _source_digest() -> str:
+    """Hash of the src/ modules that produce cached results"""
+    digest = hashlib.sha1()
+    for source in sorted((Path(__file__).resolve().parent / 'src').glob('*.py')):
+        digest.update(source.name.encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_entry_path(file: Path) -> Path:
+    """Cache file for a transcript, keyed by its absolute path"""
+    key = hashlib.sha1(str(file.resolve()).encode('utf-8')).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+
+def _cache_stamp(file: Path) -> dict:
+    """Fields a cache entry must match to be reused"""
+    st = file.stat()
+    return {
+        'version': _CACHE_VERSION,
+        'source': _source_digest(),
+        'mtime': st.st_mtime_ns,
+        'size': st.st_size,
+        # Relative deadlines ("by Friday") resolve against today's date
+        'today': datetime.now().date().isoformat(),
+    }
+
+
+def _load_cached_items(file: Path, with_context: bool) -> Optional[List[ActionItem]]:
+    """Return cached action items for an unchanged file, or None"""
+    try:
+        with open(_cache_entry_path(file), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        stamp = _cache_stamp(file)
+        if any(entry.get(k) != v for k, v in stamp.items()):
+            return None
+        if with_context and not entry.get('with_context'):
+            return None
+        return [ActionItem(**item) for item in entry['action_items']]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached_items(file: Path, with_context: bool, action_items: List[ActionItem]) -> None:
+    """Record action items for a file; failures only cost the cache"""
+    try:
+        entry = dict(_cache_stamp(file), with_context=with_context,
+                     action_items=[item.to_dict() for item in action_items])
+        payload = json.dumps(entry, ensure_ascii=False)
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_entry_path(file), 'w', encoding='utf-8') as f:
+            f.write(payload)
+    except OSError as e:
+        logger.debug(f"Could not write extraction cache for {file}: {e}")
+
+
+# Per-worker (parser, detector, generator), built once by _init_batch_worker
+_batch_tools = None
+
+
+def _init_batch_worker():
+    """
+    Build the batch pipeline objects once per worker process
+    
+    TranscriptParser, ActionDetector and SummaryGenerator keep no state
+    between calls (only compiled patterns and lookup tables set in
+    __init__), so one instance of each can serve every file a worker gets.
+    """
+    global _batch_tools
+    _batch_tools = (TranscriptParser(), ActionDetector(), SummaryGenerator())
+
+
+def _process_one(args: Tuple[Path, str, Path, bool]) -> Tuple[Path, str, Union[str, List[Tuple[str, str, str]]]]:
+    """
+    Parse, extract and render summaries for one batch file
+    
+    Runs in a worker process, so it lives at module level and reports back
+    a (file, status, detail) triple instead of echoing itself. Files are
+    written by the caller, so disk I/O overlaps with the next file's parsing.
+    
+    Args:
+        args: (transcript file, output format, output directory, use cache)
+        
+    Returns:
+        (file, status, detail) where status/detail is 'ok' with
+        [(content, path, format_type), ...], 'empty' with '', or
+        'warning'/'error' with a message
+    """
+    file, format, output_path, use_cache = args
+    if _batch_tools is None:
+        _init_batch_worker()
+    parser, detector, generator = _batch_tools
+    
+    # Batch markdown never includes context; JSON always does
+    with_context = format != 'markdown'
+    
+    try:
+        action_items = _load_cached_items(file, with_context) if use_cache else None
+        
+        if action_items is None:
+            # Parse
+            messages = parser.parse_file(str(file))
+            
+            # Extract
+            action_items = detector.extract_action_items(messages, with_context=with_context)
+            
+            if use_cache:
+                _store_cached_items(file, with_context, action_items)
+        
+        if len(action_items) == 0:
+            return file, 'empty', ''
+        
+        # Generate
+        output_file = output_path / f"{file.stem}_summary"
+        outputs = []
+        
+        if format == 'both':
+            markdown, json_str = generator.generate_both(action_items, meeting_title=file.stem)
+            outputs.append((markdown, str(output_file) + '.md', 'markdown'))
+            outputs.append((json_str, str(output_file) + '.json', 'json'))
+        
+        elif format == 'markdown':
+            markdown = generator.generate_markdown(action_items, meeting_title=file.stem)
+            outputs.append((markdown, str(output_file) + '.md', 'markdown'))
+        
+        elif format == 'json':
+            json_str = generator.generate_json(action_items, meeting_title=file.stem)
+            outputs.append((json_str, str(output_file) + '.json', 'json'))
+        
+        return file, 'ok', outputs
+        
+    except (FileNotFoundError, EmptyTranscriptError, MalformedTranscriptError) as e:
+        logger.warning(f"Failed to process {file.name}: {e.message}")
+        return file, 'warning', e.message
+        
+    except Exception as e:
+        logger.error(f"Unexpected error processing {file.name}: {e}", exc_info=True)
+        return file, 'error', str(e)
+
+
 @cli.command()
 @click.argument('folder', type=click.Path(exists=True, file_okay=False, dir_okay=True))
 @click.option(
@@ -416,7 +636,12 @@ def parse(
     is_flag=True,
     help='Process files recursively'
 )
-def batch(folder: str, format: str, pattern: str, output_dir: Optional[str], recursive: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Re-extract every file instead of reusing results for unchanged files'
+)
+def batch(folder: str, format: str, pattern: str, output_dir: Optional[str], recursive: bool, no_cache: bool):
     """
     Process multiple transcript files in a folder.
     
@@ -427,15 +652,15 @@ def batch(folder: str, format: str, pattern: str, output_dir: Optional[str], rec
       python main.py batch transcripts/
       python main.py batch meetings/ --pattern "*.txt" --recursive
       python main.py batch data/ --output-dir summaries/
+      python main.py batch meetings/ --no-cache
     """
     try:
         folder_path = Path(folder)
         
-        # Find files
-        if recursive:
-            files = list(folder_path.rglob(pattern))
-        else:
-            files = list(folder_path.glob(pattern))
+        # Find files (listed up front: the count drives the progressbar and
+        # the worker count, and outputs written under the folder must not be
+        # picked up mid-run)
+        files = list(_iter_matching(folder_path, pattern, recursive))
         
         if not files:
             click.echo(click.style(f"⚠️  No files matching '{pattern}' found in {folder}", fg='yellow'))
@@ -454,49 +679,64 @@ def batch(folder: str, format: str, pattern: str, output_dir: Optional[str], rec
         success_count = 0
         error_count = 0
         
-        with click.progressbar(
-            files,
+        # Files are independent, so spread them over worker processes;
+        # results come back in file order. Jobs are sent in chunks to cut
+        # pickling round trips, but small enough to keep every worker busy.
+        # Summaries are written from a small thread pool while the workers
+        # carry on parsing.
+        jobs = [(file, format, output_path, not no_cache) for file in files]
+        workers = min(len(jobs), os.cpu_count() or 1)
+        chunksize = max(1, min(8, len(jobs) // (workers * 4)))
+        generator = SummaryGenerator()
+        pending_writes = []
+        
+        # Per-file problems are reported after the progressbar finishes
+        # instead of being printed through it
+        empty_files = []
+        failures = []
+        
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_batch_worker
+        ) as executor, ThreadPoolExecutor(max_workers=2) as write_pool, click.progressbar(
+            executor.map(_process_one, jobs, chunksize=chunksize),
+            length=len(jobs),
             label='Processing transcripts',
-            item_show_func=lambda f: f.name if f else ''
+            item_show_func=lambda result: result[0].name if result else ''
         ) as bar:
-            for file in bar:
-                try:
-                    # Parse
-                    parser = TranscriptParser()
-                    messages = parser.parse_file(str(file))
-                    
-                    # Extract
-                    detector = ActionDetector()
-                    action_items = detector.extract_action_items(messages)
-                    
-                    if len(action_items) == 0:
-                        click.echo(f"\n⚠️  {file.name}: No action items found", err=True)
-                        continue
-                    
-                    # Generate
-                    generator = SummaryGenerator()
-                    output_file = output_path / f"{file.stem}_summary"
-                    
-                    if format == 'markdown' or format == 'both':
-                        markdown = generator.generate_markdown(action_items, meeting_title=file.stem)
-                        generator.save_to_file(markdown, str(output_file) + '.md', 'markdown')
-                    
-                    if format == 'json' or format == 'both':
-                        json_str = generator.generate_json(action_items, meeting_title=file.stem)
-                        generator.save_to_file(json_str, str(output_file) + '.json', 'json')
-                    
-                    success_count += 1
-                    logger.info(f"Successfully processed: {file.name}")
-                    
-                except (FileNotFoundError, EmptyTranscriptError, MalformedTranscriptError) as e:
-                    click.echo(f"\n⚠️  {file.name}: {e.message}", err=True)
+            for file, status, detail in bar:
+                if status == 'empty':
+                    empty_files.append(file.name)
+                elif status == 'warning':
+                    failures.append(f"⚠️  {file.name}: {detail}")
                     error_count += 1
-                    logger.warning(f"Failed to process {file.name}: {e.message}")
-                    
-                except Exception as e:
-                    click.echo(f"\n❌ {file.name}: {str(e)}", err=True)
+                elif status == 'error':
+                    failures.append(f"❌ {file.name}: {detail}")
                     error_count += 1
-                    logger.error(f"Unexpected error processing {file.name}: {e}", exc_info=True)
+                else:
+                    writes = [write_pool.submit(generator.save_to_file, *out) for out in detail]
+                    pending_writes.append((file, writes))
+        
+        # Collect write results
+        for file, writes in pending_writes:
+            try:
+                for write in writes:
+                    write.result()
+                success_count += 1
+                logger.info(f"Successfully processed: {file.name}")
+            except Exception as e:
+                failures.append(f"❌ {file.name}: {str(e)}")
+                error_count += 1
+                logger.error(f"Unexpected error processing {file.name}: {e}", exc_info=True)
+        
+        if empty_files:
+            click.echo(f"\n⚠️  {len(empty_files)} file(s) had no action items:", err=True)
+            for name in empty_files:
+                click.echo(f"   • {name}", err=True)
+        
+        if failures:
+            click.echo(f"\n⚠️  {len(failures)} file(s) could not be processed:", err=True)
+            for failure in failures:
+                click.echo(f"   {failure}", err=True)
         
         # Summary
         click.echo(click.style(f"\n✅ Batch processing complete!", fg='green', bold=True))
@@ -547,12 +787,27 @@ def validate(transcript_file: str):
         click.echo(click.style(f"\n🔍 Validating: {transcript_file}\n", fg='cyan', bold=True))
         
         parser = TranscriptParser()
-        messages = parser.parse_file(transcript_file)
+        
+        # Single streaming pass: running counts plus the first few messages
+        samples = []
+        stats = {'total_messages': 0, 'with_timestamps': 0, 'unknown_speakers': 0}
+        speaker_set = set()
+        for msg in parser.parse_file_streaming(transcript_file):
+            stats['total_messages'] += 1
+            if msg['timestamp']:
+                stats['with_timestamps'] += 1
+            if msg['speaker'] == 'Unknown':
+                stats['unknown_speakers'] += 1
+            elif msg['speaker']:
+                speaker_set.add(msg['speaker'])
+            if len(samples) < 3:
+                samples.append(msg)
+        stats['without_timestamps'] = stats['total_messages'] - stats['with_timestamps']
+        stats['unique_speakers'] = len(speaker_set)
         
         click.echo(click.style("✅ File is valid!", fg='green', bold=True))
         
         # Show statistics
-        stats = parser.get_format_stats(messages)
         click.echo(f"\n📊 Statistics:")
         click.echo(f"   Total messages: {stats['total_messages']}")
         click.echo(f"   With timestamps: {stats['with_timestamps']}")
@@ -561,13 +816,13 @@ def validate(transcript_file: str):
         click.echo(f"   Unknown speakers: {stats['unknown_speakers']}")
         
         # Show speakers
-        speakers = parser.get_speakers(messages)
+        speakers = sorted(speaker_set)
         if speakers:
             click.echo(f"\n👥 Speakers: {', '.join(speakers)}")
         
         # Show sample messages
         click.echo(f"\n📝 Sample messages:")
-        for msg in messages[:3]:
+        for msg in samples:
             timestamp = f"[{msg['timestamp']}] " if msg['timestamp'] else ""
             click.echo(f"   {timestamp}{msg['speaker']}: {msg['text'][:60]}...")
         
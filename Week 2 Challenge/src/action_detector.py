@@ -1,9 +1,14 @@
 """Detect and extract action items from meeting transcripts"""
 import re
+import sys
 import logging
+import functools
+import calendar
+from collections import Counter
+from collections.abc import Mapping
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dateutil import parser as date_parser
 from src.exceptions import (
     NoActionItemsError,
@@ -14,8 +19,11 @@ from src.exceptions import (
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ActionItem:
     """Represents a single action item from a meeting"""
     task: str
@@ -31,12 +39,192 @@ class ActionItem:
         return asdict(self)
 
 
+@dataclass(eq=False)
+class ActionStats(Mapping):
+    """Statistics about action items, each field computed on first access
+    
+    Reads like the dict get_statistics used to return: stats['total'],
+    stats.items(), dict(stats).
+    """
+    action_items: List[ActionItem]
+    
+    _fields = ('total', 'by_assignee', 'by_priority', 'with_deadline', 'without_deadline')
+    
+    @functools.cached_property
+    def total(self) -> int:
+        return len(self.action_items)
+    
+    @functools.cached_property
+    def by_assignee(self) -> Dict[str, int]:
+        return dict(Counter(item.assignee or 'Unassigned' for item in self.action_items))
+    
+    @functools.cached_property
+    def by_priority(self) -> Dict[str, int]:
+        priority_counts = Counter(item.priority for item in self.action_items)
+        return {p: priority_counts[p] for p in ('high', 'medium', 'low')}
+    
+    @functools.cached_property
+    def with_deadline(self) -> int:
+        return sum(1 for item in self.action_items if item.deadline)
+    
+    @functools.cached_property
+    def without_deadline(self) -> int:
+        return self.total - self.with_deadline
+    
+    def __getitem__(self, key: str):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary, computing every field"""
+        return dict(self)
+
+
+def _fuse_patterns(patterns: List[re.Pattern]) -> re.Pattern:
+    """Combine compiled patterns into one case-insensitive alternation"""
+    return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
+
+
+# Deadline parsers are memoized at module level (lru_cache on methods would
+# keep the detector alive). Every cache key includes today's ISO date so
+# results roll over at midnight.
+
+# Last day of each month (February adjusted for leap years at lookup)
+_EOM = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+
+# Quarter index -> (last month, last day)
+_Q_END = {0: (3, 31), 1: (6, 30), 2: (9, 30), 3: (12, 31)}
+
+
+def _today_iso() -> str:
+    """Today's date as YYYY-MM-DD"""
+    return date.today().isoformat()
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_weekday_cached(weekday: str, today_iso: str) -> str:
+    """Parse weekday to next occurrence date"""
+    weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    target_day = weekdays.index(weekday.lower())
+    today = date.fromisoformat(today_iso)
+    current_day = today.weekday()
+    
+    days_ahead = target_day - current_day
+    if days_ahead <= 0:
+        days_ahead += 7
+    
+    target_date = today + timedelta(days=days_ahead)
+    return target_date.strftime('%Y-%m-%d')
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_period_cached(period: str, today_iso: str) -> str:
+    """Parse end of period"""
+    today = date.fromisoformat(today_iso)
+    period_lower = period.lower()
+    
+    if period_lower == 'week':
+        # Next Friday
+        return _parse_weekday_cached('Friday', today_iso)
+    elif period_lower == 'month':
+        # Last day of current month
+        if today.month == 2 and calendar.isleap(today.year):
+            day = 29
+        else:
+            day = _EOM[today.month]
+        return today.replace(day=day).strftime('%Y-%m-%d')
+    elif period_lower == 'quarter':
+        # End of current quarter
+        month, day = _Q_END[(today.month - 1) // 3]
+        return f"{today.year}-{month:02d}-{day:02d}"
+    elif period_lower == 'year':
+        return f"{today.year}-12-31"
+    
+    return f"End of {period}"
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_cached(date_str: str, today_iso: str) -> str:
+    """Parse date string to ISO format"""
+    try:
+        now = datetime.now()
+        parsed = date_parser.parse(date_str, fuzzy=True)
+        # If year not specified and date is in past, assume next year
+        if parsed.year == now.year and parsed < now:
+            parsed = parsed.replace(year=parsed.year + 1)
+        return parsed.strftime('%Y-%m-%d')
+    except:
+        return date_str
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_relative_cached(relative: str, today_iso: str) -> str:
+    """Parse relative date (tomorrow, next week, etc.)"""
+    relative_lower = relative.lower()
+    today = date.fromisoformat(today_iso)
+    
+    if relative_lower == 'today':
+        return today.strftime('%Y-%m-%d')
+    elif relative_lower == 'tomorrow':
+        return (today + timedelta(days=1)).strftime('%Y-%m-%d')
+    elif relative_lower == 'tonight':
+        return today.strftime('%Y-%m-%d') + ' EOD'
+    elif relative_lower.startswith('next'):
+        # next week, next monday, etc.
+        return _parse_date_cached(relative, today_iso)
+    elif relative_lower.startswith('this'):
+        # this week, this friday, etc.
+        return _parse_date_cached(relative, today_iso)
+    
+    return relative
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_duration_cached(amount: int, unit: str, today_iso: str) -> str:
+    """Parse duration (in X days/weeks/months)"""
+    today = date.fromisoformat(today_iso)
+    
+    if unit.lower().startswith('day'):
+        target = today + timedelta(days=amount)
+    elif unit.lower().startswith('week'):
+        target = today + timedelta(weeks=amount)
+    elif unit.lower().startswith('month'):
+        target = today + timedelta(days=amount * 30)
+    else:
+        return f"in {amount} {unit}s"
+    
+    return target.strftime('%Y-%m-%d')
+
+
+# deadline_type -> parser taking (captured groups of the pattern, today_iso)
+_DEADLINE_PARSERS = {
+    'weekday': lambda g, today_iso: _parse_weekday_cached(g[0], today_iso),
+    'period': lambda g, today_iso: _parse_period_cached(g[0], today_iso),
+    'date': lambda g, today_iso: _parse_date_cached(g[0], today_iso),
+    'relative': lambda g, today_iso: _parse_relative_cached(g[0], today_iso),
+    'duration': lambda g, today_iso: _parse_duration_cached(int(g[0]), g[1], today_iso),
+    'eod': lambda g, today_iso: today_iso + ' EOD',
+    'eow': lambda g, today_iso: _parse_weekday_cached('Friday', today_iso),
+    'asap': lambda g, today_iso: 'ASAP',
+}
+
+
 class ActionDetector:
     """Detect action items from meeting transcripts"""
     
     def __init__(self):
+        # Patterns are compiled once here; all of them ignore case so call
+        # sites can search the original text
+        
         # Action keywords (ordered by strength)
-        self.action_keywords = [
+        self.action_keywords = [re.compile(p, re.IGNORECASE) for p in [
             r'\baction\s+item\b',
             r'\bTODO\b',
             r'\bto-do\b',
@@ -55,10 +243,10 @@ class ActionDetector:
             r'\btake\s+care\s+of\b',
             r'\bwork\s+on\b',
             r'\bhandle\b',
-        ]
+        ]]
         
         # Assignment patterns
-        self.assignment_patterns = [
+        self.assignment_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'@(\w+)\s+(?:will|should|needs?\s+to|must)',
             r'(\w+)\s+will\s+',
             r'(\w+)\s+should\s+',
@@ -69,10 +257,10 @@ class ActionDetector:
             r'(\w+)\s+to\s+(?:handle|work\s+on|take\s+care\s+of)',
             r'I\s+will\s+',  # Speaker is assignee
             r"I'll\s+",
-        ]
+        ]]
         
         # Deadline patterns
-        self.deadline_patterns = [
+        self.deadline_patterns = [(re.compile(p, re.IGNORECASE), kind) for p, kind in [
             (r'\bby\s+(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', 'weekday'),
             (r'\bby\s+end\s+of\s+(week|month|quarter|year)', 'period'),
             (r'\bby\s+(\w+\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?)', 'date'),
@@ -87,11 +275,11 @@ class ActionDetector:
             (r'\bEOD\b', 'eod'),  # End of day
             (r'\bEOW\b', 'eow'),  # End of week
             (r'\bASAP\b', 'asap'),
-        ]
+        ]]
         
         # Priority keywords
         self.priority_keywords = {
-            'high': [
+            'high': [re.compile(p, re.IGNORECASE) for p in [
                 r'\burgent\b',
                 r'\bASAP\b',
                 r'\bcritical\b',
@@ -100,19 +288,19 @@ class ActionDetector:
                 r'\btop\s+priority\b',
                 r'\bemergency\b',
                 r'\bblocking\b',
-            ],
-            'low': [
+            ]],
+            'low': [re.compile(p, re.IGNORECASE) for p in [
                 r'\bnice\s+to\s+have\b',
                 r'\bwhen\s+(?:you\s+)?(?:have\s+)?time\b',
                 r'\bif\s+possible\b',
                 r'\boptional\b',
                 r'\blow\s+priority\b',
                 r'\beventually\b',
-            ]
+            ]]
         }
         
         # Negative patterns (exclude these)
-        self.negative_patterns = [
+        self.negative_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'\bwon\'t\b',
             r'\bwill\s+not\b',
             r'\bshould\s+not\b',
@@ -122,14 +310,74 @@ class ActionDetector:
             r'\bmaybe\b',
             r'\bmight\b',
             r'\bcould\b',
-        ]
+        ]]
+        
+        # Each list fused into one alternation, so a message is screened by
+        # a single regex scan instead of a Python loop over patterns
+        self._action_re = _fuse_patterns(self.action_keywords + self.assignment_patterns)
+        self._negative_re = _fuse_patterns(self.negative_patterns)
+        self._priority_high_re = _fuse_patterns(self.priority_keywords['high'])
+        self._priority_low_re = _fuse_patterns(self.priority_keywords['low'])
+        
+        # "Has an action indicator and no negative pattern" as one anchored
+        # regex, so the main loop makes a single call per message
+        self._actionable_re = re.compile(
+            rf'\A(?!.*?(?:{self._negative_re.pattern}))(?=.*?(?:{self._action_re.pattern}))',
+            re.IGNORECASE | re.DOTALL
+        )
+        
+        # Deadline patterns fused into one regex anchored at the start. Each
+        # alternative is a lookahead over the whole text, tried in list order,
+        # so the first pattern that matches anywhere still wins; its named
+        # group _d<i> tells which one it was.
+        self._deadline_re = re.compile(
+            r'\A(?:' + '|'.join(
+                f'(?=.*?(?P<_d{i}>{pattern.pattern}))'
+                for i, (pattern, _) in enumerate(self.deadline_patterns)
+            ) + ')',
+            re.IGNORECASE | re.DOTALL
+        )
+        # group name -> (deadline_type, index of its first inner group, inner group count)
+        self._deadline_groups = {
+            f'_d{i}': (kind, self._deadline_re.groupindex[f'_d{i}'], pattern.groups)
+            for i, (pattern, kind) in enumerate(self.deadline_patterns)
+        }
+        
+        # Task prefix ("Action item:", "TODO:", "Task:") and its cheap screen
+        self._task_prefix_re = re.compile(r'^(?:action\s+item:?|TODO:?|task:?)\s*', re.IGNORECASE)
+        self._task_prefix_starts = ('action', 'todo', 'task')
+        
+        # Assignee patterns
+        self._mention_re = re.compile(r'@(\w+)')
+        self._i_will_re = re.compile(r'\bI\s+(?:will|should|need\s+to|must|\'ll|can)\b', re.IGNORECASE)
+        self._name_action_re = re.compile(
+            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:will|should|needs?\s+to|must|can)\b'
+        )
+        self._assigned_to_re = re.compile(r'assign(?:ed)?\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+        self._will_must_re = re.compile(r'\b(?:will|must)\b', re.IGNORECASE)
+        
+        # Capitalized words that look like names but are not assignees
+        self._stopwords = frozenset({
+            'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+            'sure', 'got', 'yes', 'okay', 'right', 'also', 'one', 'will', 'sounds', 'that', 'good',
+        })
+        
+        # Literal fragments, at least one of which every action keyword or
+        # assignment pattern contains; keep in sync when adding patterns
+        self._fast_kws = (
+            'action', 'todo', 'to-do', 'task', 'follow', 'need', 'has', 'have',
+            'must', 'should', 'will', 'gonna', 'going', 'responsible', 'take',
+            'work', 'handle', 'assign', "i'll",
+        )
     
-    def extract_action_items(self, transcript_data: List[Dict]) -> List[ActionItem]:
+    def extract_action_items(self, transcript_data: List[Dict], with_context: bool = True) -> List[ActionItem]:
         """
         Extract action items from parsed transcript
         
         Args:
             transcript_data: List of message dictionaries from parser
+            with_context: Build the surrounding-messages context for each item;
+                callers that never render it can skip the string building
             
         Returns:
             List of ActionItem objects
@@ -172,21 +420,25 @@ class ActionDetector:
                     if not text or not text.strip():
                         continue
                     
-                    # Check if message contains action indicators
-                    if not self._is_action_item(text):
-                        continue
-                    
-                    # Skip if contains negative patterns
-                    if self._has_negative_pattern(text):
-                        logger.debug(f"Skipping message with negative pattern: {text[:50]}")
+                    # Check for action indicators, skipping negative patterns
+                    text_lower = text.lower()
+                    if not self._is_actionable(text, text_lower):
+                        if (logger.isEnabledFor(logging.DEBUG) and self._has_negative_pattern(text)
+                                and self._is_action_item(text, text_lower)):
+                            logger.debug(f"Skipping message with negative pattern: {text[:50]}")
                         continue
                     
                     # Extract components
                     task = self._extract_task(text)
+                    if not task:
+                        # Nothing left once the prefix is stripped (a bare "TODO")
+                        logger.debug(f"Skipping action item with empty task: {text[:50]}")
+                        continue
+                    
                     assignee = self._extract_assignee(text, speaker)
                     deadline = self._extract_deadline(text)
                     priority = self._detect_priority(text)
-                    context = self._get_context(transcript_data, i)
+                    context = self._get_context(transcript_data, i) if with_context else ""
                     
                     action_item = ActionItem(
                         task=task,
@@ -213,34 +465,35 @@ class ActionDetector:
             logger.error(f"Unexpected error during action item extraction: {e}", exc_info=True)
             raise MalformedTranscriptError(f"Failed to extract action items: {str(e)}")
     
-    def _is_action_item(self, text: str) -> bool:
+    def _is_action_item(self, text: str, text_lower: str) -> bool:
         """Check if text contains action item indicators"""
-        text_lower = text.lower()
+        # Cheap substring screen before running the regex engine
+        if not any(kw in text_lower for kw in self._fast_kws):
+            return False
         
-        # Check for action keywords
-        for pattern in self.action_keywords:
-            if re.search(pattern, text_lower):
-                return True
-        
-        # Check for assignment patterns
-        for pattern in self.assignment_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        # Action keywords or assignment patterns
+        return self._action_re.search(text) is not None
+    
+    def _is_actionable(self, text: str, text_lower: str) -> bool:
+        """Check for action indicators and no negative pattern in one pass"""
+        # Same cheap screen as _is_action_item
+        if not any(kw in text_lower for kw in self._fast_kws):
+            return False
         
-        return False
+        return self._actionable_re.match(text) is not None
     
     def _has_negative_pattern(self, text: str) -> bool:
         """Check if text contains negative patterns that negate action"""
-        text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.negative_patterns)
+        return self._negative_re.search(text) is not None
     
     def _extract_task(self, text: str) -> str:
         """Extract the task description"""
         # Remove common prefixes
         task = text
         
-        # Remove action item prefix
-        task = re.sub(r'^(?:action\s+item:?|TODO:?|task:?)\s*', '', task, flags=re.IGNORECASE)
+        # Remove action item prefix (regex only runs when one can be present)
+        if task[:6].lower().startswith(self._task_prefix_starts):
+            task = self._task_prefix_re.sub('', task, count=1)
         
         # Clean up
         task = task.strip()
@@ -254,163 +507,78 @@ class ActionDetector:
     def _extract_assignee(self, text: str, speaker: str) -> Optional[str]:
         """Extract assignee from text"""
         # Check for @mentions
-        mention_match = re.search(r'@(\w+)', text)
+        mention_match = self._mention_re.search(text)
         if mention_match:
             return mention_match.group(1)
         
         # Check for "I will" pattern first - speaker is assignee
-        if re.search(r'\bI\s+(?:will|should|need\s+to|must|\'ll|can)\b', text, re.IGNORECASE):
+        if self._i_will_re.search(text):
             return speaker
         
         # Check for explicit assignment with proper names
         # Pattern: "Name will/should/needs to/must"
-        name_action_match = re.search(
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:will|should|needs?\s+to|must|can)\b',
-            text
-        )
+        name_action_match = self._name_action_re.search(text)
         if name_action_match:
             name = name_action_match.group(1)
             # Verify it's not a common word
-            if name.lower() not in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday', 'sure', 'got', 'yes', 'okay', 'right', 'also', 'one', 'will', 'sounds', 'that', 'good']:
+            if name.lower() not in self._stopwords:
                 return name
         
         # Check for "assigned to Name" pattern
-        assigned_match = re.search(r'assign(?:ed)?\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', text)
+        assigned_match = self._assigned_to_re.search(text)
         if assigned_match:
             return assigned_match.group(1)
         
         # Default to speaker if strong action verb present and no other assignee found
-        if re.search(r'\b(?:will|must)\b', text, re.IGNORECASE):
+        if self._will_must_re.search(text):
             return speaker
         
         return None
     
     def _extract_deadline(self, text: str) -> Optional[str]:
         """Extract and normalize deadline from text"""
-        for pattern, deadline_type in self.deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    if deadline_type == 'weekday':
-                        return self._parse_weekday(match.group(1))
-                    elif deadline_type == 'period':
-                        return self._parse_period(match.group(1))
-                    elif deadline_type == 'date':
-                        return self._parse_date(match.group(1))
-                    elif deadline_type == 'relative':
-                        return self._parse_relative(match.group(1))
-                    elif deadline_type == 'duration':
-                        return self._parse_duration(int(match.group(1)), match.group(2))
-                    elif deadline_type == 'eod':
-                        return datetime.now().strftime('%Y-%m-%d') + ' EOD'
-                    elif deadline_type == 'eow':
-                        return self._parse_weekday('Friday')
-                    elif deadline_type == 'asap':
-                        return 'ASAP'
-                except:
-                    # If parsing fails, return the matched text
-                    return match.group(0)
+        match = self._deadline_re.search(text)
+        if not match:
+            return None
         
-        return None
+        name = match.lastgroup
+        deadline_type, first, count = self._deadline_groups[name]
+        try:
+            groups = match.groups()[first:first + count]
+            return _DEADLINE_PARSERS[deadline_type](groups, _today_iso())
+        except:
+            # If parsing fails, return the matched text
+            return match.group(name)
     
     def _parse_weekday(self, weekday: str) -> str:
         """Parse weekday to next occurrence date"""
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        target_day = weekdays.index(weekday.lower())
-        today = datetime.now()
-        current_day = today.weekday()
-        
-        days_ahead = target_day - current_day
-        if days_ahead <= 0:
-            days_ahead += 7
-        
-        target_date = today + timedelta(days=days_ahead)
-        return target_date.strftime('%Y-%m-%d')
+        return _parse_weekday_cached(weekday, _today_iso())
     
     def _parse_period(self, period: str) -> str:
         """Parse end of period"""
-        today = datetime.now()
-        period_lower = period.lower()
-        
-        if period_lower == 'week':
-            # Next Friday
-            return self._parse_weekday('Friday')
-        elif period_lower == 'month':
-            # Last day of current month
-            next_month = today.replace(day=28) + timedelta(days=4)
-            last_day = next_month - timedelta(days=next_month.day)
-            return last_day.strftime('%Y-%m-%d')
-        elif period_lower == 'quarter':
-            # End of current quarter
-            quarter = (today.month - 1) // 3
-            last_month = (quarter + 1) * 3
-            last_day = datetime(today.year, last_month, 1) + timedelta(days=32)
-            last_day = last_day.replace(day=1) - timedelta(days=1)
-            return last_day.strftime('%Y-%m-%d')
-        elif period_lower == 'year':
-            return f"{today.year}-12-31"
-        
-        return f"End of {period}"
+        return _parse_period_cached(period, _today_iso())
     
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to ISO format"""
-        try:
-            parsed = date_parser.parse(date_str, fuzzy=True)
-            # If year not specified and date is in past, assume next year
-            if parsed.year == datetime.now().year and parsed < datetime.now():
-                parsed = parsed.replace(year=parsed.year + 1)
-            return parsed.strftime('%Y-%m-%d')
-        except:
-            return date_str
+        return _parse_date_cached(date_str, _today_iso())
     
     def _parse_relative(self, relative: str) -> str:
         """Parse relative date (tomorrow, next week, etc.)"""
-        relative_lower = relative.lower()
-        today = datetime.now()
-        
-        if relative_lower == 'today':
-            return today.strftime('%Y-%m-%d')
-        elif relative_lower == 'tomorrow':
-            return (today + timedelta(days=1)).strftime('%Y-%m-%d')
-        elif relative_lower == 'tonight':
-            return today.strftime('%Y-%m-%d') + ' EOD'
-        elif relative_lower.startswith('next'):
-            # next week, next monday, etc.
-            return self._parse_date(relative)
-        elif relative_lower.startswith('this'):
-            # this week, this friday, etc.
-            return self._parse_date(relative)
-        
-        return relative
+        return _parse_relative_cached(relative, _today_iso())
     
     def _parse_duration(self, amount: int, unit: str) -> str:
         """Parse duration (in X days/weeks/months)"""
-        today = datetime.now()
-        
-        if unit.lower().startswith('day'):
-            target = today + timedelta(days=amount)
-        elif unit.lower().startswith('week'):
-            target = today + timedelta(weeks=amount)
-        elif unit.lower().startswith('month'):
-            target = today + timedelta(days=amount * 30)
-        else:
-            return f"in {amount} {unit}s"
-        
-        return target.strftime('%Y-%m-%d')
+        return _parse_duration_cached(amount, unit, _today_iso())
     
     def _detect_priority(self, text: str) -> str:
         """Detect priority level from text"""
-        text_lower = text.lower()
-        
         # Check high priority keywords
-        for pattern in self.priority_keywords['high']:
-            if re.search(pattern, text_lower):
-                return 'high'
+        if self._priority_high_re.search(text):
+            return 'high'
         
         # Check low priority keywords
-        for pattern in self.priority_keywords['low']:
-            if re.search(pattern, text_lower):
-                return 'low'
+        if self._priority_low_re.search(text):
+            return 'low'
         
         # Check for deadline-based priority
         if re.search(r'\b(?:ASAP|today|tonight|EOD)\b', text, re.IGNORECASE):
@@ -421,15 +589,11 @@ class ActionDetector:
     def _get_context(self, transcript_data: List[Dict], current_index: int, window: int = 1) -> str:
         """Get surrounding context for action item"""
         start = max(0, current_index - window)
-        end = min(len(transcript_data), current_index + window + 1)
+        neighbours = transcript_data[start:current_index] + transcript_data[current_index + 1:current_index + window + 1]
         
-        context_messages = []
-        for i in range(start, end):
-            if i != current_index:
-                msg = transcript_data[i]
-                context_messages.append(f"{msg.get('speaker', 'Unknown')}: {msg.get('text', '')[:100]}")
-        
-        return " | ".join(context_messages) if context_messages else ""
+        return " | ".join(
+            f"{msg.get('speaker', 'Unknown')}: {msg.get('text', '')[:100]}" for msg in neighbours
+        )
     
     def _clean_name(self, name: str) -> str:
         """Clean and normalize names"""
@@ -445,31 +609,6 @@ class ActionDetector:
         """Filter action items by priority"""
         return [item for item in action_items if item.priority == priority.lower()]
     
-    def get_statistics(self, action_items: List[ActionItem]) -> Dict:
-        """Get statistics about action items"""
-        total = len(action_items)
-        
-        # Count by assignee
-        by_assignee = {}
-        for item in action_items:
-            assignee = item.assignee or 'Unassigned'
-            by_assignee[assignee] = by_assignee.get(assignee, 0) + 1
-        
-        # Count by priority
-        by_priority = {
-            'high': len([i for i in action_items if i.priority == 'high']),
-            'medium': len([i for i in action_items if i.priority == 'medium']),
-            'low': len([i for i in action_items if i.priority == 'low']),
-        }
-        
-        # Count with/without deadlines
-        with_deadline = len([i for i in action_items if i.deadline])
-        without_deadline = total - with_deadline
-        
-        return {
-            'total': total,
-            'by_assignee': by_assignee,
-            'by_priority': by_priority,
-            'with_deadline': with_deadline,
-            'without_deadline': without_deadline,
-        }
+    def get_statistics(self, action_items: List[ActionItem]) -> ActionStats:
+        """Get statistics about action items (each field computed on first access)"""
+        return ActionStats(action_items)
@@ -1,24 +1,196 @@
 """Send meeting summaries via email"""
 import os
+import re
+import html
 import smtplib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 from datetime import datetime
 
 from src.exceptions import InvalidInputError, OutputError
 
+try:
+    import aiosmtplib
+except ImportError:  # optional dependency
+    aiosmtplib = None
+
+try:
+    import cmarkgfm
+except ImportError:  # optional dependency
+    cmarkgfm = None
+
+try:
+    import mistune
+except ImportError:  # optional dependency
+    mistune = None
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Markdown bold markers and their HTML replacement
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_HTML = r'<strong>\1</strong>'
+
+# Static HTML email shell around the per-meeting title block and content
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #34495e;
+            margin-top: 30px;
+            border-bottom: 2px solid #ecf0f1;
+            padding-bottom: 8px;
+        }
+        h3 {
+            color: #7f8c8d;
+            margin-top: 20px;
+        }
+        ul {
+            list-style-type: none;
+            padding-left: 0;
+        }
+        li {
+            margin: 10px 0;
+            padding: 10px;
+            background-color: #f8f9fa;
+            border-left: 4px solid #3498db;
+            border-radius: 4px;
+        }
+        .priority-high {
+            border-left-color: #e74c3c;
+        }
+        .priority-medium {
+            border-left-color: #f39c12;
+        }
+        .priority-low {
+            border-left-color: #2ecc71;
+        }
+        .stats {
+            background-color: #ecf0f1;
+            padding: 15px;
+            border-radius: 6px;
+            margin: 20px 0;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ecf0f1;
+            color: #7f8c8d;
+            font-size: 0.9em;
+        }
+        code {
+            background-color: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }
+        .assignee {
+            color: #3498db;
+            font-weight: bold;
+        }
+        .deadline {
+            color: #e74c3c;
+            font-weight: bold;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+
+_HTML_TAIL = """
+        </div>
+        
+        <div class="footer">
+            <p>This summary was automatically generated by the Meeting Action Items Extractor.</p>
+            <p>Please review your assigned action items and reach out if you have any questions.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Minimal address shape: local part, '@', domain containing a dot
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Non-empty, trimmed tokens of a comma-separated address list
+_EMAIL_SPLIT_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+# Static parts of the plain-text email body
+_PT_HEADER = (
+    "Hello Team,\n\n"
+    "Please find below the action items from our {title} meeting held on {date}."
+)
+_PT_SEP = '=' * 70
+_PT_FOOTER = (
+    "This summary was automatically generated by the Meeting Action Items Extractor.\n\n"
+    "Please review your assigned action items and reach out if you have any questions.\n\n"
+    "Best regards,\n"
+    "Meeting Action Items Extractor"
+)
+
+# SMTP replies worth retrying: service unavailable, mailbox busy
+_RETRY_CODES = frozenset({421, 450})
+
+# Concurrent session limits for common providers
+_PROVIDER_CONCURRENCY = {
+    'smtp.gmail.com': 15,
+    'smtp.zoho.com': 5,
+    'smtp.zoho.eu': 5,
+}
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a send failure was caused by a dropped connection or a retryable SMTP reply"""
+    cause = error.__cause__
+    if isinstance(cause, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(cause, smtplib.SMTPResponseException):
+        return cause.smtp_code in _RETRY_CODES
+    # Socket-level failures (resets, timeouts); other SMTP errors are final
+    return isinstance(cause, OSError) and not isinstance(cause, smtplib.SMTPException)
+
 
 class EmailSender:
     """Send meeting summaries via email using SMTP"""
     
+    # Recycle a pooled connection after this many messages
+    MAX_MESSAGES_PER_CONNECTION = 100
+    
+    # Probe a pooled connection with NOOP only after it sat idle this long (seconds)
+    IDLE_PROBE_SECONDS = 30.0
+    
     def __init__(
         self,
         smtp_server: Optional[str] = None,
@@ -44,10 +216,49 @@ class EmailSender:
         self.smtp_password = smtp_password or os.getenv('SMTP_PASSWORD', '')
         self.use_tls = use_tls
         
+        # Pooled connection, only set while used as a context manager
+        self._server: Optional[smtplib.SMTP] = None
+        self._sent_on_server = 0
+        self._last_used = 0.0
+        
         # Validate credentials
         if not self.smtp_username or not self.smtp_password:
             logger.warning("SMTP credentials not configured")
     
+    def __enter__(self) -> 'EmailSender':
+        """Open one authenticated SMTP session reused by every send"""
+        self._check_credentials()
+        
+        try:
+            self._reconnect()
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error(f"SMTP authentication failed: {e}")
+            raise OutputError(
+                "Email authentication failed. Check SMTP_USERNAME and SMTP_PASSWORD"
+            )
+        except (smtplib.SMTPException, OSError) as e:
+            logger.error(f"SMTP connection failed: {e}")
+            raise OutputError(f"Failed to connect to SMTP server: {str(e)}") from e
+        
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        """Close the pooled SMTP session"""
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled SMTP session if one is open"""
+        if self._server is None:
+            return
+        
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        
+        self._server = None
+        self._sent_on_server = 0
+    
     def send_summary(
         self,
         recipients: List[str],
@@ -81,76 +292,28 @@ class EmailSender:
             InvalidInputError: If input validation fails
             OutputError: If email sending fails
         """
-        # Input validation
-        if not recipients or not isinstance(recipients, list):
-            raise InvalidInputError("recipients", "Must be a non-empty list of email addresses")
-        
-        if not all('@' in email for email in recipients):
-            raise InvalidInputError("recipients", "All recipients must be valid email addresses")
-        
-        if not meeting_title or not isinstance(meeting_title, str):
-            raise InvalidInputError("meeting_title", "Must be a non-empty string")
-        
-        if not summary_content or not isinstance(summary_content, str):
-            raise InvalidInputError("summary_content", "Must be a non-empty string")
+        all_recipients = self._validate_summary_args(
+            recipients, meeting_title, summary_content, cc, bcc
+        )
         
         # Check credentials
-        if not self.smtp_username or not self.smtp_password:
-            raise OutputError(
-                "SMTP credentials not configured. Set SMTP_USERNAME and SMTP_PASSWORD environment variables"
-            )
+        self._check_credentials()
         
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            
-            # Set sender
             sender = sender_email or self.smtp_username
-            msg['From'] = sender
-            msg['To'] = ', '.join(recipients)
-            
-            if cc:
-                msg['Cc'] = ', '.join(cc)
-            
-            # Set subject
-            subject = f"Action Items from {meeting_title} - {meeting_date}"
-            msg['Subject'] = subject
-            msg['Date'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
-            
-            # Create email body
-            if format_type == 'markdown':
-                # Convert markdown to HTML for better email display
-                html_body = self._markdown_to_html(summary_content, meeting_title, meeting_date)
-                plain_body = self._create_plain_text_body(summary_content, meeting_title, meeting_date)
-                
-                # Attach both plain text and HTML versions
-                msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
-                msg.attach(MIMEText(html_body, 'html', 'utf-8'))
-            else:
-                plain_body = self._create_plain_text_body(summary_content, meeting_title, meeting_date)
-                msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
-            
-            # Attach transcript if provided
-            if transcript_path and Path(transcript_path).exists():
-                self._attach_file(msg, transcript_path)
+            msg = self._build_message(
+                recipients, meeting_title, meeting_date, summary_content,
+                format_type, transcript_path, sender, cc
+            )
             
             # Send email
             logger.info(f"Sending email to {len(recipients)} recipient(s)")
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                server.login(self.smtp_username, self.smtp_password)
-                
-                # Combine all recipients
-                all_recipients = recipients.copy()
-                if cc:
-                    all_recipients.extend(cc)
-                if bcc:
-                    all_recipients.extend(bcc)
-                
-                server.send_message(msg, from_addr=sender, to_addrs=all_recipients)
+            if self._server is not None:
+                self._send_pooled(msg, sender, all_recipients)
+            else:
+                with self._new_server() as server:
+                    server.send_message(msg, from_addr=sender, to_addrs=all_recipients)
             
             logger.info(f"Email sent successfully to {', '.join(recipients)}")
             return True
@@ -163,11 +326,245 @@ class EmailSender:
         
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error: {e}")
-            raise OutputError(f"Failed to send email: {str(e)}")
+            raise OutputError(f"Failed to send email: {str(e)}") from e
         
         except Exception as e:
             logger.error(f"Unexpected error sending email: {e}", exc_info=True)
-            raise OutputError(f"Failed to send email: {str(e)}")
+            raise OutputError(f"Failed to send email: {str(e)}") from e
+    
+    def send_bulk(self, messages: Iterable[Dict]) -> int:
+        """
+        Send several summaries over a single SMTP session
+        
+        Args:
+            messages: Iterable of keyword-argument dicts for send_summary
+            
+        Returns:
+            Number of emails sent
+            
+        Raises:
+            InvalidInputError: If input validation fails
+            OutputError: If email sending fails
+        """
+        owns_connection = self._server is None
+        if owns_connection:
+            self.__enter__()
+        
+        sent = 0
+        try:
+            for message in messages:
+                self.send_summary(**message)
+                sent += 1
+        finally:
+            if owns_connection:
+                self.close()
+        
+        logger.info(f"Sent {sent} email(s) over one SMTP session")
+        return sent
+    
+    def send_many(
+        self,
+        jobs: Iterable[Dict],
+        concurrency: int = 5,
+        max_retries: int = 3
+    ) -> List[bool]:
+        """
+        Send summaries in parallel over several pooled SMTP sessions
+        
+        Each worker thread keeps its own authenticated session. Sends that
+        fail with a transient SMTP reply are retried with exponential backoff.
+        
+        Args:
+            jobs: Iterable of keyword-argument dicts for send_summary
+            concurrency: Number of parallel SMTP sessions (capped per provider)
+            max_retries: Retries per email for transient failures
+            
+        Returns:
+            Per-job success flags, in job order
+            
+        Raises:
+            InvalidInputError: If input validation fails
+            OutputError: If SMTP credentials are not configured
+        """
+        self._check_credentials()
+        
+        cap = _PROVIDER_CONCURRENCY.get(self.smtp_server.lower(), concurrency)
+        concurrency = max(1, min(concurrency, cap))
+        
+        local = threading.local()
+        senders = []
+        senders_lock = threading.Lock()
+        
+        def worker_sender() -> 'EmailSender':
+            sender = getattr(local, 'sender', None)
+            if sender is None:
+                sender = type(self)(
+                    self.smtp_server, self.smtp_port,
+                    self.smtp_username, self.smtp_password, self.use_tls
+                )
+                sender.MAX_MESSAGES_PER_CONNECTION = self.MAX_MESSAGES_PER_CONNECTION
+                sender.IDLE_PROBE_SECONDS = self.IDLE_PROBE_SECONDS
+                sender.__enter__()
+                local.sender = sender
+                with senders_lock:
+                    senders.append(sender)
+            return sender
+        
+        def send(job: Dict) -> bool:
+            for attempt in range(max_retries + 1):
+                try:
+                    return worker_sender().send_summary(**job)
+                except OutputError as e:
+                    if attempt == max_retries or not _is_transient(e):
+                        logger.error(f"Giving up on email to {job.get('recipients')}: {e.message}")
+                        return False
+                    
+                    delay = 2 ** attempt
+                    logger.warning(f"Transient SMTP failure, retrying in {delay}s: {e.message}")
+                    time.sleep(delay)
+            return False
+        
+        logger.info(f"Sending emails over {concurrency} SMTP session(s)")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                results = list(pool.map(send, jobs))
+        finally:
+            for sender in senders:
+                sender.close()
+        
+        logger.info(f"Sent {sum(results)} of {len(results)} email(s)")
+        return results
+    
+    def _validate_summary_args(
+        self,
+        recipients: List[str],
+        meeting_title: str,
+        summary_content: str,
+        cc: Optional[List[str]],
+        bcc: Optional[List[str]]
+    ) -> List[str]:
+        """Validate send_summary arguments and return the envelope recipients"""
+        # Input validation
+        if not recipients or not isinstance(recipients, list):
+            raise InvalidInputError("recipients", "Must be a non-empty list of email addresses")
+        
+        invalid = [email for email in recipients if not _EMAIL_RE.match(email)]
+        if invalid:
+            raise InvalidInputError(
+                "recipients",
+                f"All recipients must be valid email addresses (invalid: {', '.join(invalid)})"
+            )
+        
+        if not meeting_title or not isinstance(meeting_title, str):
+            raise InvalidInputError("meeting_title", "Must be a non-empty string")
+        
+        if not summary_content or not isinstance(summary_content, str):
+            raise InvalidInputError("summary_content", "Must be a non-empty string")
+        
+        # Envelope recipients, built in a single allocation
+        return [*recipients, *(cc or ()), *(bcc or ())]
+    
+    def _build_message(
+        self,
+        recipients: List[str],
+        meeting_title: str,
+        meeting_date: str,
+        summary_content: str,
+        format_type: str,
+        transcript_path: Optional[str],
+        sender: str,
+        cc: Optional[List[str]]
+    ) -> MIMEMultipart:
+        """Build the MIME message for a summary email"""
+        # Create message
+        msg = MIMEMultipart('alternative')
+        
+        # Set sender
+        msg['From'] = sender
+        msg['To'] = ', '.join(recipients)
+        
+        if cc:
+            msg['Cc'] = ', '.join(cc)
+        
+        # Set subject
+        subject = f"Action Items from {meeting_title} - {meeting_date}"
+        msg['Subject'] = subject
+        msg['Date'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
+        
+        # Create email body
+        if format_type == 'markdown':
+            # Convert markdown to HTML for better email display
+            html_body = self._markdown_to_html(summary_content, meeting_title, meeting_date)
+            plain_body = self._create_plain_text_body(summary_content, meeting_title, meeting_date)
+            
+            # Attach both plain text and HTML versions
+            msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
+            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+        else:
+            plain_body = self._create_plain_text_body(summary_content, meeting_title, meeting_date)
+            msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
+        
+        # Attach transcript if provided
+        if transcript_path and Path(transcript_path).exists():
+            self._attach_file(msg, transcript_path)
+        
+        return msg
+    
+    def _check_credentials(self) -> None:
+        """Raise if SMTP credentials are missing"""
+        if not self.smtp_username or not self.smtp_password:
+            raise OutputError(
+                "SMTP credentials not configured. Set SMTP_USERNAME and SMTP_PASSWORD environment variables"
+            )
+    
+    def _new_server(self) -> smtplib.SMTP:
+        """Open an SMTP session, upgrade it to TLS and log in"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        
+        try:
+            if self.use_tls:
+                server.starttls()
+            
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    def _reconnect(self) -> None:
+        """Replace the pooled session with a fresh one"""
+        self.close()
+        self._server = self._new_server()
+        self._last_used = time.monotonic()
+    
+    def _is_alive(self) -> bool:
+        """Check the pooled session with a NOOP"""
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _send_pooled(self, msg: MIMEMultipart, sender: str, all_recipients: List[str]) -> None:
+        """Send on the pooled session, reconnecting when it is spent or stale"""
+        # A busy session is just used; a dropped one is caught below. Only a
+        # session idle long enough for the server to have timed it out is probed.
+        idle = time.monotonic() - self._last_used
+        if (self._sent_on_server >= self.MAX_MESSAGES_PER_CONNECTION
+                or (idle >= self.IDLE_PROBE_SECONDS and not self._is_alive())):
+            logger.debug("Recycling SMTP connection")
+            self._reconnect()
+        
+        try:
+            self._server.send_message(msg, from_addr=sender, to_addrs=all_recipients)
+        except smtplib.SMTPServerDisconnected:
+            logger.info("SMTP connection dropped, reconnecting")
+            self._reconnect()
+            self._server.send_message(msg, from_addr=sender, to_addrs=all_recipients)
+        
+        self._sent_on_server += 1
+        self._last_used = time.monotonic()
     
     def _create_plain_text_body(
         self,
@@ -176,25 +573,10 @@ class EmailSender:
         meeting_date: str
     ) -> str:
         """Create plain text email body"""
-        template = f"""
-Hello Team,
-
-Please find below the action items from our {meeting_title} meeting held on {meeting_date}.
-
-{'='*70}
-
-{summary_content}
-
-{'='*70}
-
-This summary was automatically generated by the Meeting Action Items Extractor.
-
-Please review your assigned action items and reach out if you have any questions.
-
-Best regards,
-Meeting Action Items Extractor
-"""
-        return template.strip()
+        return (
+            f"{_PT_HEADER.format(title=meeting_title, date=meeting_date)}\n\n"
+            f"{_PT_SEP}\n\n{summary_content}\n\n{_PT_SEP}\n\n{_PT_FOOTER}"
+        )
     
     def _markdown_to_html(
         self,
@@ -203,154 +585,65 @@ Meeting Action Items Extractor
         meeting_date: str
     ) -> str:
         """Convert markdown summary to HTML for email"""
-        # Simple markdown to HTML conversion
-        # For production, consider using a library like markdown2 or mistune
+        title_block = (
+            '        <div style="text-align: center; margin-bottom: 30px;">\n'
+            f'            <h1>📋 {html.escape(meeting_title)}</h1>\n'
+            f'            <p><strong>Date:</strong> {html.escape(meeting_date)}</p>\n'
+            '        </div>\n'
+            '        \n'
+            '        <div class="content">\n'
+            '            '
+        )
         
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-            border-bottom: 2px solid #ecf0f1;
-            padding-bottom: 8px;
-        }}
-        h3 {{
-            color: #7f8c8d;
-            margin-top: 20px;
-        }}
-        ul {{
-            list-style-type: none;
-            padding-left: 0;
-        }}
-        li {{
-            margin: 10px 0;
-            padding: 10px;
-            background-color: #f8f9fa;
-            border-left: 4px solid #3498db;
-            border-radius: 4px;
-        }}
-        .priority-high {{
-            border-left-color: #e74c3c;
-        }}
-        .priority-medium {{
-            border-left-color: #f39c12;
-        }}
-        .priority-low {{
-            border-left-color: #2ecc71;
-        }}
-        .stats {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 6px;
-            margin: 20px 0;
-        }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ecf0f1;
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-        .assignee {{
-            color: #3498db;
-            font-weight: bold;
-        }}
-        .deadline {{
-            color: #e74c3c;
-            font-weight: bold;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div style="text-align: center; margin-bottom: 30px;">
-            <h1>📋 {meeting_title}</h1>
-            <p><strong>Date:</strong> {meeting_date}</p>
-        </div>
+        # Use a compiled markdown library when installed, else the simple converter
+        return _HTML_HEAD + title_block + self._render_markdown(markdown_content) + _HTML_TAIL
+    
+    def _render_markdown(self, markdown: str) -> str:
+        """Render markdown with the fastest available converter"""
+        if cmarkgfm is not None:
+            return cmarkgfm.github_flavored_markdown_to_html(markdown)
         
-        <div class="content">
-            {self._convert_markdown_to_html_simple(markdown_content)}
-        </div>
+        if mistune is not None:
+            return mistune.html(markdown)
         
-        <div class="footer">
-            <p>This summary was automatically generated by the Meeting Action Items Extractor.</p>
-            <p>Please review your assigned action items and reach out if you have any questions.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        return self._convert_markdown_to_html_simple(markdown)
     
     def _convert_markdown_to_html_simple(self, markdown: str) -> str:
-        """Simple markdown to HTML conversion"""
-        html = markdown
-        
-        # Convert headers
-        html = html.replace('# ', '<h1>').replace('\n\n', '</h1>\n\n')
-        html = html.replace('## ', '<h2>').replace('\n\n', '</h2>\n\n')
-        html = html.replace('### ', '<h3>').replace('\n\n', '</h3>\n\n')
-        
-        # Convert bold
-        import re
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        
-        # Convert lists
-        lines = html.split('\n')
-        in_list = False
+        """Simple markdown to HTML conversion in a single pass over the lines"""
         result = []
+        in_list = False
         
-        for line in lines:
-            if line.strip().startswith('- '):
+        for line in markdown.splitlines():
+            stripped = line.strip()
+            
+            # Convert lists
+            if stripped.startswith('- '):
                 if not in_list:
                     result.append('<ul>')
                     in_list = True
-                result.append(f'<li>{line.strip()[2:]}</li>')
+                result.append(f'<li>{_BOLD_RE.sub(_BOLD_HTML, stripped[2:])}</li>')
+                continue
+            
+            if in_list:
+                result.append('</ul>')
+                in_list = False
+            
+            # Convert headers, paragraph breaks and bold text
+            if not stripped:
+                result.append('<br>')
+            elif line.startswith('### '):
+                result.append(f'<h3>{_BOLD_RE.sub(_BOLD_HTML, line[4:])}</h3>')
+            elif line.startswith('## '):
+                result.append(f'<h2>{_BOLD_RE.sub(_BOLD_HTML, line[3:])}</h2>')
+            elif line.startswith('# '):
+                result.append(f'<h1>{_BOLD_RE.sub(_BOLD_HTML, line[2:])}</h1>')
             else:
-                if in_list:
-                    result.append('</ul>')
-                    in_list = False
-                result.append(line)
+                result.append(_BOLD_RE.sub(_BOLD_HTML, line))
         
         if in_list:
             result.append('</ul>')
         
-        html = '\n'.join(result)
-        
-        # Convert line breaks
-        html = html.replace('\n\n', '<br><br>')
-        
-        return html
+        return '\n'.join(result)
     
     def _attach_file(self, msg: MIMEMultipart, file_path: str) -> None:
         """Attach a file to the email"""
@@ -401,6 +694,143 @@ Meeting Action Items Extractor
             return False
 
 
+class AsyncEmailSender(EmailSender):
+    """Send meeting summaries over a reusable asyncio SMTP connection"""
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize async email sender
+        
+        Args:
+            *args: Same as EmailSender
+            **kwargs: Same as EmailSender
+            
+        Raises:
+            OutputError: If aiosmtplib is not installed
+        """
+        if aiosmtplib is None:
+            raise OutputError(
+                "aiosmtplib is not installed. Install it with: pip install aiosmtplib"
+            )
+        
+        super().__init__(*args, **kwargs)
+        self._smtp = None
+    
+    async def __aenter__(self) -> 'AsyncEmailSender':
+        """Open the SMTP connection up front"""
+        self._check_credentials()
+        await self._connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, tb) -> None:
+        """Close the SMTP connection"""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the SMTP connection if one is open"""
+        if self._smtp is None:
+            return
+        
+        try:
+            await self._smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._smtp.close()
+        
+        self._smtp = None
+    
+    async def send_summary_async(
+        self,
+        recipients: List[str],
+        meeting_title: str,
+        meeting_date: str,
+        summary_content: str,
+        format_type: str = 'markdown',
+        transcript_path: Optional[str] = None,
+        sender_email: Optional[str] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send meeting summary via email without blocking the event loop
+        
+        The connection stays open between calls; close it with aclose()
+        or by using the sender as an async context manager.
+        
+        Args:
+            recipients: List of recipient email addresses
+            meeting_title: Title of the meeting
+            meeting_date: Date of the meeting
+            summary_content: Summary content (markdown or plain text)
+            format_type: 'markdown' or 'plain'
+            transcript_path: Optional path to transcript file to attach
+            sender_email: Sender email (default: SMTP username)
+            cc: Optional CC recipients
+            bcc: Optional BCC recipients
+            
+        Returns:
+            True if email sent successfully
+            
+        Raises:
+            InvalidInputError: If input validation fails
+            OutputError: If email sending fails
+        """
+        all_recipients = self._validate_summary_args(
+            recipients, meeting_title, summary_content, cc, bcc
+        )
+        
+        # Check credentials
+        self._check_credentials()
+        
+        try:
+            sender = sender_email or self.smtp_username
+            msg = self._build_message(
+                recipients, meeting_title, meeting_date, summary_content,
+                format_type, transcript_path, sender, cc
+            )
+            
+            logger.info(f"Sending email to {len(recipients)} recipient(s)")
+            
+            if self._smtp is None or not self._smtp.is_connected:
+                await self._connect()
+            
+            try:
+                await self._smtp.send_message(msg, sender=sender, recipients=all_recipients)
+            except aiosmtplib.SMTPServerDisconnected:
+                logger.info("SMTP connection dropped, reconnecting")
+                await self._connect()
+                await self._smtp.send_message(msg, sender=sender, recipients=all_recipients)
+            
+            logger.info(f"Email sent successfully to {', '.join(recipients)}")
+            return True
+            
+        except aiosmtplib.SMTPAuthenticationError as e:
+            logger.error(f"SMTP authentication failed: {e}")
+            raise OutputError(
+                "Email authentication failed. Check SMTP_USERNAME and SMTP_PASSWORD"
+            )
+        
+        except aiosmtplib.SMTPException as e:
+            logger.error(f"SMTP error: {e}")
+            raise OutputError(f"Failed to send email: {str(e)}") from e
+        
+        except Exception as e:
+            logger.error(f"Unexpected error sending email: {e}", exc_info=True)
+            raise OutputError(f"Failed to send email: {str(e)}") from e
+    
+    async def _connect(self) -> None:
+        """Open, upgrade and authenticate a fresh SMTP connection"""
+        await self.aclose()
+        
+        smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=False)
+        await smtp.connect()
+        
+        if self.use_tls:
+            await smtp.starttls()
+        
+        await smtp.login(self.smtp_username, self.smtp_password)
+        self._smtp = smtp
+
+
 def parse_email_list(email_string: str) -> List[str]:
     """
     Parse comma-separated email addresses
@@ -411,13 +841,5 @@ def parse_email_list(email_string: str) -> List[str]:
     Returns:
         List of email addresses
     """
-    if not email_string:
-        return []
-    
-    # Split by comma and clean up
-    emails = [email.strip() for email in email_string.split(',')]
-    
-    # Filter out empty strings
-    emails = [email for email in emails if email]
-    
-    return emails
+    # Match each comma-separated token without surrounding whitespace
+    return _EMAIL_SPLIT_RE.findall(email_string) if email_string else []
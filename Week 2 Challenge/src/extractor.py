@@ -1,8 +1,31 @@
 """Extract action items from parsed transcripts"""
 import re
+import functools
+from datetime import date
 from typing import List, Dict, Optional
 from dateutil import parser as date_parser
 
+# Literal fragments, one of which every action pattern match contains;
+# keep in sync with ActionItemExtractor.action_patterns
+_TRIGGERS = frozenset({
+    'will', 'should', 'need to', 'must', 'have to', 'going to', 'gonna',
+    'action item', 'todo', 'task', 'follow up', 'follow-up', 'assign', 'owner',
+})
+
+# Case-insensitive screen for any trigger, so messages are not lowercased first
+_TRIGGER_RE = re.compile('|'.join(map(re.escape, sorted(_TRIGGERS))), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_deadline(deadline_text: str, today_iso: str) -> str:
+    """Format a deadline phrase as YYYY-MM-DD, or return it unchanged (cached per day)"""
+    try:
+        # Try to parse as date
+        parsed_date = date_parser.parse(deadline_text, fuzzy=True)
+        return parsed_date.strftime('%Y-%m-%d')
+    except Exception:
+        return deadline_text
+
 
 class ActionItemExtractor:
     """Extract action items, assignees, and deadlines"""
@@ -22,8 +45,25 @@ class ActionItemExtractor:
             r'\b(in\s+\d+\s+(?:day|week|month)s?)\b',
         ]
         
+        # Each list fused into one regex. Deadline alternatives are lookaheads
+        # anchored at the start, so the first pattern that matches anywhere
+        # wins (as with the loop); group _d<i> marks which one matched.
+        self._action_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.action_patterns), re.IGNORECASE
+        )
+        self._deadline_re = re.compile(
+            r'\A(?:' + '|'.join(
+                f'(?=.*?(?P<_d{i}>{p}))' for i, p in enumerate(self.deadline_patterns)
+            ) + ')',
+            re.IGNORECASE | re.DOTALL
+        )
+        
         # Name patterns (simple heuristic)
         self.name_pattern = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b')
+        
+        # Assignee patterns (case-sensitive on purpose: names are capitalized)
+        self._assign_re = re.compile(r'(?:assign|assigned to|owner:?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+        self._i_will_re = re.compile(r'\bI\s+(will|should|need to|must)\b')
     
     def extract(self, messages: List[Dict[str, str]]) -> List[Dict[str, any]]:
         """Extract action items from messages"""
@@ -50,20 +90,21 @@ class ActionItemExtractor:
     
     def _is_action_item(self, text: str) -> bool:
         """Check if text contains action item indicators"""
-        text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.action_patterns)
+        # Cheap literal screen before running the full patterns
+        if not _TRIGGER_RE.search(text):
+            return False
+        
+        return self._action_re.search(text) is not None
     
     def _extract_assignee(self, text: str, default_speaker: str) -> str:
         """Extract assignee from text"""
-        text_lower = text.lower()
-        
         # Look for explicit assignment
-        assign_match = re.search(r'(?:assign|assigned to|owner:?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', text)
+        assign_match = self._assign_re.search(text)
         if assign_match:
             return assign_match.group(1)
         
         # Look for "I will" pattern
-        if re.search(r'\bI\s+(will|should|need to|must)\b', text):
+        if self._i_will_re.search(text):
             return default_speaker
         
         # Extract first capitalized name
@@ -75,15 +116,8 @@ class ActionItemExtractor:
     
     def _extract_deadline(self, text: str) -> Optional[str]:
         """Extract deadline from text"""
-        for pattern in self.deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                deadline_text = match.group(0)
-                try:
-                    # Try to parse as date
-                    parsed_date = date_parser.parse(deadline_text, fuzzy=True)
-                    return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    return deadline_text
+        match = self._deadline_re.search(text)
+        if match:
+            return _parse_deadline(match.group(match.lastgroup), date.today().isoformat())
         
         return None
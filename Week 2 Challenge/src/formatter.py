@@ -1,4 +1,5 @@
 """Format action items as Markdown"""
+from collections import defaultdict
 from typing import List, Dict
 from datetime import datetime
 
@@ -19,12 +20,9 @@ class MarkdownFormatter:
         ]
         
         # Group by assignee
-        by_assignee = {}
+        by_assignee = defaultdict(list)
         for item in action_items:
-            assignee = item['assignee']
-            if assignee not in by_assignee:
-                by_assignee[assignee] = []
-            by_assignee[assignee].append(item)
+            by_assignee[item['assignee']].append(item)
         
         # Format by assignee
         for assignee, items in sorted(by_assignee.items()):
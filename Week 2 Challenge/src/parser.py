@@ -1,7 +1,7 @@
 """Parse meeting transcripts from various formats"""
 import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
 from pathlib import Path
 from src.exceptions import (
     FileNotFoundError,
@@ -15,10 +15,39 @@ from src.exceptions import (
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Timestamp, speaker and text group names for each TranscriptParser._line_re format
+_LINE_GROUPS = {
+    'zoom': ('z_ts', 'z_sp', 'z_txt'),
+    'bracket': ('b_ts', 'b_sp', 'b_txt'),
+    'meet': ('m_ts', 'm_sp', 'm_txt'),
+    'plain': (None, 'p_sp', 'p_txt'),
+}
+
+
+def _fallback_latin1(line: str) -> str:
+    """Re-decode a line read with surrogateescape as latin-1 if it was not valid UTF-8"""
+    try:
+        line.encode('utf-8')
+        return line
+    except UnicodeEncodeError:
+        return line.encode('utf-8', 'surrogateescape').decode('latin-1')
+
 
 class TranscriptParser:
     """Parse meeting transcripts and normalize format"""
     
+    # Header/footer lines to skip: separators, meeting IDs, recording notices
+    _METADATA_RE = re.compile(
+        r'(?i)^(?:={3,}|-{3,}|Meeting\s+ID:|Passcode:|Recording\s+(?:started|ended)'
+        r'|Transcript\s+(?:started|ended)|\d+\s+participants?|Zoom\s+Meeting|Google\s+Meet)'
+    )
+    # Characters a metadata line can start with (digits checked separately)
+    _METADATA_FIRST_CHARS = frozenset('=-MmPpRrTtZzGg')
+    
+    # Speaker annotations such as "(you)", "(host)" or "[host]"
+    _SPEAKER_PAREN_RE = re.compile(r'\s*\(.*?\)\s*')
+    _SPEAKER_BRACKET_RE = re.compile(r'\s*\[.*?\]\s*')
+    
     def __init__(self):
         # Zoom format: "00:00:00 John Doe: Message"
         self.zoom_pattern = re.compile(
@@ -46,6 +75,17 @@ class TranscriptParser:
             r'^(.+?)\s+\[(\d{1,2}:\d{2}(?:\s*[AP]M)?)\]$',
             re.IGNORECASE
         )
+        
+        # All message formats in one alternation, tried in _parse_line order;
+        # the outer group name tells which format matched
+        self._line_re = re.compile(
+            r'^(?:'
+            r'(?P<zoom>(?P<z_ts>\d{2}:\d{2}:\d{2})\s+(?P<z_sp>.+?):\s+(?P<z_txt>.+))'
+            r'|(?P<bracket>\[(?P<b_ts>\d{2}:\d{2}:\d{2})\]\s+(?P<b_sp>.+?):\s+(?P<b_txt>.+))'
+            r'|(?P<meet>(?i:(?P<m_ts>\d{1,2}:\d{2}(?:\s*[AP]M)?)\s+(?P<m_sp>.+?):\s+(?P<m_txt>.+)))'
+            r'|(?P<plain>(?P<p_sp>[A-Z][a-zA-Z\s\.]+?):\s+(?P<p_txt>.+))'
+            r')$'
+        )
     
     def parse_file(self, file_path: str) -> List[Dict[str, str]]:
         """
@@ -65,31 +105,10 @@ class TranscriptParser:
             MalformedTranscriptError: If content cannot be parsed
         """
         # Input validation
-        if not file_path:
-            logger.error("Empty file path provided")
-            raise InvalidInputError("file_path", "Path cannot be empty")
-        
-        if not isinstance(file_path, (str, Path)):
-            logger.error(f"Invalid file path type: {type(file_path)}")
-            raise InvalidInputError("file_path", f"Expected string or Path, got {type(file_path)}")
+        self._check_input_path(file_path)
         
         try:
-            path = Path(file_path)
-            
-            # Check if file exists
-            if not path.exists():
-                logger.error(f"File not found: {file_path}")
-                raise FileNotFoundError(str(file_path))
-            
-            # Check if it's a file (not directory)
-            if not path.is_file():
-                logger.error(f"Path is not a file: {file_path}")
-                raise InvalidInputError("file_path", "Path must point to a file, not a directory")
-            
-            # Check file extension
-            if path.suffix.lower() not in ['.txt', '']:
-                logger.warning(f"Unsupported file extension: {path.suffix}")
-                raise UnsupportedFormatError(path.suffix)
+            path = self._check_file_path(file_path)
             
             # Try to read file with UTF-8 encoding
             try:
@@ -106,7 +125,7 @@ class TranscriptParser:
                     raise EncodingError("UTF-8, latin-1")
             
             # Check if file is empty
-            if not content or not content.strip():
+            if not content or content.isspace():
                 logger.error("File is empty")
                 raise EmptyTranscriptError()
             
@@ -121,6 +140,87 @@ class TranscriptParser:
             logger.error(f"Unexpected error reading file: {e}", exc_info=True)
             raise MalformedTranscriptError(f"Error reading file: {str(e)}")
     
+    def parse_file_streaming(self, file_path: str) -> Iterator[Dict[str, str]]:
+        """
+        Parse transcript from file, yielding messages as they are read
+        
+        Same messages as parse_file, but the file is never held in memory
+        as a whole. Lines that are not valid UTF-8 are decoded as latin-1
+        individually rather than re-reading the file.
+        
+        Args:
+            file_path: Path to transcript file
+            
+        Yields:
+            Message dictionaries
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            UnsupportedFormatError: If file type is not supported
+            EmptyTranscriptError: If file is empty
+            MalformedTranscriptError: If content cannot be parsed
+        """
+        # Input validation
+        self._check_input_path(file_path)
+        
+        try:
+            path = self._check_file_path(file_path)
+            counts = {'valid_lines': 0, 'messages': 0}
+            
+            with open(path, 'r', encoding='utf-8', errors='surrogateescape') as f:
+                lines = (_fallback_latin1(line) for line in f)
+                yield from self._iter_messages(lines, counts)
+            
+            if not counts['valid_lines']:
+                logger.error("File is empty")
+                raise EmptyTranscriptError()
+            
+            if not counts['messages']:
+                logger.error(f"No valid messages found in {counts['valid_lines']} lines")
+                raise MalformedTranscriptError(
+                    f"No valid messages found. Processed {counts['valid_lines']} lines but couldn't identify speaker/message format"
+                )
+            
+            logger.info(f"Successfully parsed {counts['messages']} messages from {counts['valid_lines']} lines")
+            
+        except (FileNotFoundError, UnsupportedFormatError, EmptyTranscriptError,
+                MalformedTranscriptError, InvalidInputError):
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error reading file: {e}", exc_info=True)
+            raise MalformedTranscriptError(f"Error reading file: {str(e)}")
+    
+    def _check_input_path(self, file_path) -> None:
+        """Validate the file path argument itself"""
+        if not file_path:
+            logger.error("Empty file path provided")
+            raise InvalidInputError("file_path", "Path cannot be empty")
+        
+        if not isinstance(file_path, (str, Path)):
+            logger.error(f"Invalid file path type: {type(file_path)}")
+            raise InvalidInputError("file_path", f"Expected string or Path, got {type(file_path)}")
+    
+    def _check_file_path(self, file_path) -> Path:
+        """Check the path points to an existing transcript file"""
+        path = Path(file_path)
+        
+        # Check if file exists
+        if not path.exists():
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(str(file_path))
+        
+        # Check if it's a file (not directory)
+        if not path.is_file():
+            logger.error(f"Path is not a file: {file_path}")
+            raise InvalidInputError("file_path", "Path must point to a file, not a directory")
+        
+        # Check file extension
+        if path.suffix.lower() not in ['.txt', '']:
+            logger.warning(f"Unsupported file extension: {path.suffix}")
+            raise UnsupportedFormatError(path.suffix)
+        
+        return path
+    
     def parse(self, content: str) -> List[Dict[str, str]]:
         """
         Parse transcript content and return structured messages
@@ -141,68 +241,29 @@ class TranscriptParser:
             logger.error(f"Invalid content type: {type(content)}")
             raise InvalidInputError("content", f"Expected string, got {type(content)}")
         
-        if not content or not content.strip():
+        if not content or content.isspace():
             logger.error("Empty transcript content")
             raise EmptyTranscriptError()
         
         try:
-            lines = content.strip().split('\n')
-            messages = []
-            current_message = None
-            valid_lines = 0
+            # Blank lines are skipped while grouping, so no strip() copy is needed
+            lines = content.split('\n')
+            counts = {'valid_lines': 0, 'messages': 0}
             
             logger.debug(f"Parsing {len(lines)} lines")
             
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # Skip empty lines
-                if not line:
-                    continue
-                
-                valid_lines += 1
-                
-                # Skip common header/footer patterns
-                if self._is_metadata_line(line):
-                    logger.debug(f"Skipping metadata line {line_num}: {line[:50]}")
-                    continue
-                
-                # Try to parse as new message
-                parsed = self._parse_line(line)
-                
-                if parsed:
-                    # Save previous message if exists
-                    if current_message:
-                        messages.append(current_message)
-                    
-                    current_message = parsed
-                    logger.debug(f"Parsed message from {parsed['speaker']}")
-                else:
-                    # Continuation of previous message
-                    if current_message:
-                        current_message['text'] += ' ' + line
-                    else:
-                        # No previous message, treat as plain text
-                        current_message = {
-                            'timestamp': '',
-                            'speaker': 'Unknown',
-                            'text': line,
-                            'line_number': line_num
-                        }
-            
-            # Add last message
-            if current_message:
-                messages.append(current_message)
+            messages = list(self._iter_messages(lines, counts))
+            valid_lines = counts['valid_lines']
             
-            # Validate we found messages
-            if not messages:
+            # Validate we found messages (before dropping noise)
+            if not counts['messages']:
                 logger.error(f"No valid messages found in {valid_lines} lines")
                 raise MalformedTranscriptError(
                     f"No valid messages found. Processed {valid_lines} lines but couldn't identify speaker/message format"
                 )
             
-            logger.info(f"Successfully parsed {len(messages)} messages from {valid_lines} lines")
-            return self._clean_messages(messages)
+            logger.info(f"Successfully parsed {counts['messages']} messages from {valid_lines} lines")
+            return messages
             
         except (EmptyTranscriptError, MalformedTranscriptError, InvalidInputError):
             raise
@@ -210,65 +271,110 @@ class TranscriptParser:
             logger.error(f"Unexpected error during parsing: {e}", exc_info=True)
             raise MalformedTranscriptError(f"Parsing failed: {str(e)}")
     
-    def _parse_line(self, line: str) -> Optional[Dict[str, str]]:
+    def _iter_messages(self, lines: Iterable[str], counts: Dict[str, int]) -> Iterator[Dict[str, str]]:
         """
-        Try to parse a line with all known formats
+        Group raw lines into messages, yielding each once it is complete
         
-        Returns:
-            Dictionary with timestamp, speaker, text or None if no match
+        Messages shorter than two characters are dropped as noise.
+        
+        Args:
+            lines: Transcript lines
+            counts: Updated in place with the number of non-empty lines
+                and of messages found (including dropped ones)
+            
+        Yields:
+            Message dictionaries with timestamp, speaker and text
         """
-        # Try Zoom format
-        match = self.zoom_pattern.match(line)
-        if match:
-            return {
-                'timestamp': match.group(1),
-                'speaker': self._clean_speaker_name(match.group(2)),
-                'text': match.group(3).strip()
-            }
+        current_message = None
+        # Text chunks of current_message, joined once when it is emitted
+        text_parts = []
+        
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            
+            # Skip empty lines
+            if not line:
+                continue
+            
+            counts['valid_lines'] += 1
+            
+            # Skip common header/footer patterns
+            if self._is_metadata_line(line):
+                logger.debug(f"Skipping metadata line {line_num}: {line[:50]}")
+                continue
+            
+            # Try to parse as new message
+            parsed = self._parse_line(line)
+            
+            if parsed:
+                # Emit previous message if exists
+                if current_message and self._finish_message(current_message, text_parts, counts):
+                    yield current_message
+                
+                current_message = parsed
+                text_parts = [parsed['text']]
+                logger.debug(f"Parsed message from {parsed['speaker']}")
+            else:
+                # Continuation of previous message
+                if current_message:
+                    text_parts.append(line)
+                else:
+                    # No previous message, treat as plain text
+                    current_message = {
+                        'timestamp': '',
+                        'speaker': 'Unknown',
+                        'text': line,
+                        'line_number': line_num
+                    }
+                    text_parts = [line]
         
-        # Try bracket format
-        match = self.bracket_pattern.match(line)
-        if match:
-            return {
-                'timestamp': match.group(1),
-                'speaker': self._clean_speaker_name(match.group(2)),
-                'text': match.group(3).strip()
-            }
+        # Emit last message
+        if current_message and self._finish_message(current_message, text_parts, counts):
+            yield current_message
+    
+    def _finish_message(self, message: Dict[str, str], text_parts: List[str], counts: Dict[str, int]) -> bool:
+        """Join a message's text and tell whether it should be kept"""
+        counts['messages'] += 1
+        message['text'] = ' '.join(text_parts)
         
-        # Try Google Meet format
-        match = self.meet_pattern.match(line)
-        if match:
-            return {
-                'timestamp': match.group(1).strip(),
-                'speaker': self._clean_speaker_name(match.group(2)),
-                'text': match.group(3).strip()
-            }
+        # Skip very short messages (likely noise)
+        if len(message['text']) < 2:
+            return False
         
-        # Try plain text format (speaker: message)
-        match = self.plain_pattern.match(line)
-        if match:
-            return {
-                'timestamp': '',
-                'speaker': self._clean_speaker_name(match.group(1)),
-                'text': match.group(2).strip()
-            }
+        # Remove line_number if present (internal use only)
+        message.pop('line_number', None)
+        return True
+    
+    def _parse_line(self, line: str) -> Optional[Dict[str, str]]:
+        """
+        Try to parse a line with all known formats
         
-        # Check for Teams format (speaker [time])
-        match = self.teams_pattern.match(line)
-        if match:
-            # This is just the header, next line should be the message
+        Returns:
+            Dictionary with timestamp, speaker, text or None if no match
+        """
+        # Teams headers ("speaker [time]") match none of these and are
+        # treated like any other unparsed line
+        match = self._line_re.match(line)
+        if not match:
             return None
         
-        return None
+        ts_group, speaker_group, text_group = _LINE_GROUPS[match.lastgroup]
+        return {
+            'timestamp': match.group(ts_group).strip() if ts_group else '',
+            'speaker': self._clean_speaker_name(match.group(speaker_group)),
+            'text': match.group(text_group).strip()
+        }
     
     def _clean_speaker_name(self, name: str) -> str:
         """Clean and normalize speaker names"""
         # Remove extra whitespace
         name = ' '.join(name.split())
         
-        # Remove common prefixes/suffixes
-        name = re.sub(r'\s*\(.*?\)\s*', '', name)  # Remove (you), (host), etc.
-        name = re.sub(r'\s*\[.*?\]\s*', '', name)  # Remove [host], etc.
+        # Remove common prefixes/suffixes, skipping the regex when there are none
+        if '(' in name:
+            name = self._SPEAKER_PAREN_RE.sub('', name)  # Remove (you), (host), etc.
+        if '[' in name:
+            name = self._SPEAKER_BRACKET_RE.sub('', name)  # Remove [host], etc.
         
         # Capitalize properly
         name = name.strip()
@@ -277,41 +383,12 @@ class TranscriptParser:
     
     def _is_metadata_line(self, line: str) -> bool:
         """Check if line is metadata (header/footer) and should be skipped"""
-        metadata_patterns = [
-            r'^={3,}',  # Separator lines
-            r'^-{3,}',
-            r'^Meeting\s+ID:',
-            r'^Passcode:',
-            r'^Recording\s+started',
-            r'^Recording\s+ended',
-            r'^Transcript\s+(?:started|ended)',
-            r'^\d+\s+participants?',
-            r'^Zoom\s+Meeting',
-            r'^Google\s+Meet',
-        ]
-        
-        return any(re.match(pattern, line, re.IGNORECASE) for pattern in metadata_patterns)
-    
-    def _clean_messages(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Clean and validate messages"""
-        cleaned = []
-        
-        for msg in messages:
-            # Skip very short messages (likely noise)
-            if len(msg['text']) < 2:
-                continue
-            
-            # Remove line_number if present (internal use only)
-            msg.pop('line_number', None)
-            
-            # Ensure all required fields exist
-            msg.setdefault('timestamp', '')
-            msg.setdefault('speaker', 'Unknown')
-            msg.setdefault('text', '')
-            
-            cleaned.append(msg)
+        # Most dialogue lines are ruled out by their first character alone
+        first = line[:1]
+        if first not in self._METADATA_FIRST_CHARS and not first.isdigit():
+            return False
         
-        return cleaned
+        return self._METADATA_RE.match(line) is not None
     
     def get_speakers(self, messages: List[Dict[str, str]]) -> List[str]:
         """Extract unique speaker names from messages"""
@@ -1,7 +1,9 @@
 """Generate meeting summaries from extracted action items"""
+import io
+import re
 import json
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
@@ -12,13 +14,38 @@ from src.exceptions import (
     NoActionItemsError
 )
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+def _dumps_json(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces int/None keys
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Body of generate_markdown after the header when there are no action items
+_EMPTY_MARKDOWN_SECTIONS = (
+    "## ✅ Action Items\n\n"
+    "*No action items detected in this meeting.*\n\n"
+    "## 🚀 Next Steps\n\n"
+    "*No immediate next steps identified.*\n\n"
+)
+
+
 class SummaryGenerator:
     """Generate formatted summaries from action items"""
     
+    # Deadlines listed under "Urgent Deadlines" in the next steps section
+    _URGENT_RE = re.compile(r'ASAP|TODAY|TOMORROW|EOD', re.IGNORECASE)
+    
     def __init__(self):
         self.priority_emojis = {
             'high': '🔴',
@@ -32,7 +59,8 @@ class SummaryGenerator:
         meeting_title: str = "Meeting",
         meeting_date: Optional[str] = None,
         include_stats: bool = True,
-        include_context: bool = False
+        include_context: bool = False,
+        statistics: Optional[Dict] = None
     ) -> str:
         """
         Generate a formatted Markdown summary
@@ -43,6 +71,7 @@ class SummaryGenerator:
             meeting_date: Date of the meeting (defaults to today)
             include_stats: Include statistics section
             include_context: Include context for each action item
+            statistics: Precomputed statistics dict (see generate_both)
             
         Returns:
             Formatted Markdown string
@@ -61,42 +90,52 @@ class SummaryGenerator:
             raise InvalidInputError("meeting_title", "Must be a non-empty string")
         
         try:
+            now = datetime.now()
             if meeting_date is None:
-                meeting_date = datetime.now().strftime('%B %d, %Y')
+                meeting_date = now.strftime('%B %d, %Y')
             
             logger.info(f"Generating markdown for {len(action_items)} action items")
             
-            sections = []
+            # Every line is written newline-terminated into one buffer
+            buf = io.StringIO()
             
             # Header
-            sections.append(f"# 📋 {meeting_title}")
-            sections.append(f"\n**Date:** {meeting_date}")
-            sections.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-            sections.append("---\n")
-            
-            # Statistics
-            if include_stats and action_items:
-                sections.append(self._generate_stats_section(action_items))
-            
-            # Action Items
-            sections.append(self._generate_action_items_section(action_items, include_context))
-            
-            # Action Items by Assignee
-            if action_items:
-                sections.append(self._generate_by_assignee_section(action_items))
-            
-            # Action Items by Priority
-            if action_items:
-                sections.append(self._generate_by_priority_section(action_items))
-            
-            # Upcoming Deadlines
-            if action_items:
-                sections.append(self._generate_deadlines_section(action_items))
-            
-            # Next Steps
-            sections.append(self._generate_next_steps_section(action_items))
-            
-            markdown = "\n".join(sections)
+            buf.write(f"# 📋 {meeting_title}\n")
+            buf.write(f"\n**Date:** {meeting_date}\n")
+            buf.write(f"**Generated:** {now.strftime('%Y-%m-%d %H:%M')}\n\n")
+            buf.write("---\n\n")
+            
+            if not action_items:
+                # Only the two placeholder sections apply; nothing to group
+                buf.write(_EMPTY_MARKDOWN_SECTIONS)
+            else:
+                # Group once; every section below reads from these groups
+                groups = self._group_items(action_items)
+                display_assignee = groups['display_assignee']
+                
+                # Statistics
+                if include_stats:
+                    if statistics is None:
+                        statistics = self._generate_statistics_dict(action_items, groups)
+                    self._generate_stats_section(buf, statistics)
+                
+                # Action Items
+                self._generate_action_items_section(buf, action_items, include_context, display_assignee)
+                
+                # Action Items by Assignee
+                self._generate_by_assignee_section(buf, groups['by_assignee'])
+                
+                # Action Items by Priority
+                self._generate_by_priority_section(buf, groups['by_priority'], display_assignee)
+                
+                # Upcoming Deadlines
+                self._generate_deadlines_section(buf, groups['with_deadline'], display_assignee)
+                
+                # Next Steps
+                self._generate_next_steps_section(buf, groups)
+            
+            # Drop the newline after the last line
+            markdown = buf.getvalue()[:-1]
             logger.info(f"Successfully generated markdown ({len(markdown)} characters)")
             return markdown
             
@@ -104,117 +143,121 @@ class SummaryGenerator:
             logger.error(f"Error generating markdown: {e}", exc_info=True)
             raise OutputError(f"Markdown generation failed: {str(e)}")
     
-    def _generate_stats_section(self, action_items: List[ActionItem]) -> str:
+    def _generate_stats_section(self, buf: io.StringIO, statistics: Dict) -> None:
         """Generate statistics section"""
-        total = len(action_items)
-        
-        # Count by priority
-        high = len([i for i in action_items if i.priority == 'high'])
-        medium = len([i for i in action_items if i.priority == 'medium'])
-        low = len([i for i in action_items if i.priority == 'low'])
-        
-        # Count with deadlines
-        with_deadline = len([i for i in action_items if i.deadline])
-        
-        # Count assigned
-        assigned = len([i for i in action_items if i.assignee])
-        
-        # Unique assignees
-        assignees = set(i.assignee for i in action_items if i.assignee)
-        
-        section = [
-            "## 📊 Summary Statistics\n",
-            f"- **Total Action Items:** {total}",
-            f"- **Assigned:** {assigned} | **Unassigned:** {total - assigned}",
-            f"- **With Deadlines:** {with_deadline}",
-            f"- **Unique Assignees:** {len(assignees)}",
-            f"- **Priority Breakdown:**",
-            f"  - {self.priority_emojis['high']} High: {high}",
-            f"  - {self.priority_emojis['medium']} Medium: {medium}",
-            f"  - {self.priority_emojis['low']} Low: {low}",
-            "\n---\n"
-        ]
-        
-        return "\n".join(section)
+        by_priority = statistics['by_priority']
+        
+        buf.write(
+            "## 📊 Summary Statistics\n\n"
+            f"- **Total Action Items:** {statistics['total_items']}\n"
+            f"- **Assigned:** {statistics['assigned']} | **Unassigned:** {statistics['unassigned']}\n"
+            f"- **With Deadlines:** {statistics['with_deadline']}\n"
+            f"- **Unique Assignees:** {statistics['unique_assignees']}\n"
+            f"- **Priority Breakdown:**\n"
+            f"  - {self.priority_emojis['high']} High: {by_priority['high']}\n"
+            f"  - {self.priority_emojis['medium']} Medium: {by_priority['medium']}\n"
+            f"  - {self.priority_emojis['low']} Low: {by_priority['low']}\n"
+            "\n---\n\n"
+        )
     
-    def _generate_action_items_section(self, action_items: List[ActionItem], include_context: bool) -> str:
+    def _generate_action_items_section(
+        self,
+        buf: io.StringIO,
+        action_items: List[ActionItem],
+        include_context: bool,
+        display_assignee: Dict[Optional[str], str]
+    ) -> None:
         """Generate main action items section"""
-        section = ["## ✅ Action Items\n"]
-        
-        if not action_items:
-            section.append("*No action items detected in this meeting.*\n")
-            return "\n".join(section)
+        buf.write("## ✅ Action Items\n\n")
         
         for idx, item in enumerate(action_items, 1):
             # Priority emoji
             priority_emoji = self.priority_emojis.get(item.priority, '⚪')
             
             # Assignee
-            assignee_str = f"@{item.assignee}" if item.assignee else "*Unassigned*"
+            assignee_str = display_assignee[item.assignee]
             
             # Deadline
             deadline_str = f"📅 **Deadline:** {item.deadline}" if item.deadline else ""
             
             # Build task line
-            task_line = f"{idx}. {priority_emoji} [ ] {item.task}"
-            section.append(task_line)
+            buf.write(f"{idx}. {priority_emoji} [ ] {item.task}\n")
             
             # Add metadata
-            metadata = []
-            metadata.append(f"   - **Assignee:** {assignee_str}")
+            buf.write(f"   - **Assignee:** {assignee_str}\n")
             if deadline_str:
-                metadata.append(f"   - {deadline_str}")
+                buf.write(f"   - {deadline_str}\n")
             if item.priority != 'medium':
-                metadata.append(f"   - **Priority:** {item.priority.capitalize()}")
+                buf.write(f"   - **Priority:** {item.priority.capitalize()}\n")
             if item.timestamp:
-                metadata.append(f"   - **Mentioned at:** {item.timestamp}")
-            
-            section.extend(metadata)
+                buf.write(f"   - **Mentioned at:** {item.timestamp}\n")
             
             # Add context if requested
             if include_context and item.context:
-                section.append(f"   - *Context:* {item.context[:150]}...")
+                buf.write(f"   - *Context:* {item.context[:150]}...\n")
             
-            section.append("")  # Empty line between items
+            buf.write("\n")  # Empty line between items
         
-        section.append("---\n")
-        return "\n".join(section)
+        buf.write("---\n\n")
     
-    def _generate_by_assignee_section(self, action_items: List[ActionItem]) -> str:
-        """Generate action items grouped by assignee"""
-        section = ["## 👥 Action Items by Assignee\n"]
-        
-        # Group by assignee
+    def _group_items(self, action_items: List[ActionItem]) -> Dict:
+        """Group action items by assignee, priority and deadline in one pass"""
         by_assignee = defaultdict(list)
+        # "@Name" / "*Unassigned*" label per distinct assignee value
+        display_assignee = {}
+        by_priority = {'high': [], 'medium': [], 'low': []}
+        with_deadline = []
+        assignees = set()
+        assigned = 0
+        
         for item in action_items:
-            assignee = item.assignee if item.assignee else "Unassigned"
-            by_assignee[assignee].append(item)
+            by_assignee[item.assignee or "Unassigned"].append(item)
+            if item.assignee not in display_assignee:
+                display_assignee[item.assignee] = f"@{item.assignee}" if item.assignee else "*Unassigned*"
+            bucket = by_priority.get(item.priority)
+            if bucket is not None:
+                bucket.append(item)
+            if item.deadline:
+                with_deadline.append(item)
+            if item.assignee:
+                assigned += 1
+                assignees.add(item.assignee)
+        
+        return {
+            'by_assignee': by_assignee,
+            'by_priority': by_priority,
+            'with_deadline': with_deadline,
+            'assignees': assignees,
+            'assigned': assigned,
+            'display_assignee': display_assignee,
+        }
+    
+    def _generate_by_assignee_section(self, buf: io.StringIO, by_assignee: Dict[str, List[ActionItem]]) -> None:
+        """Generate action items grouped by assignee"""
+        buf.write("## 👥 Action Items by Assignee\n\n")
         
         # Sort by assignee name
         for assignee in sorted(by_assignee.keys()):
             items = by_assignee[assignee]
-            section.append(f"### {assignee} ({len(items)} items)\n")
+            buf.write(f"### {assignee} ({len(items)} items)\n\n")
             
             for item in items:
                 priority_emoji = self.priority_emojis.get(item.priority, '⚪')
                 deadline = f" - 📅 {item.deadline}" if item.deadline else ""
-                section.append(f"- {priority_emoji} {item.task}{deadline}")
+                buf.write(f"- {priority_emoji} {item.task}{deadline}\n")
             
-            section.append("")  # Empty line between assignees
+            buf.write("\n")  # Empty line between assignees
         
-        section.append("---\n")
-        return "\n".join(section)
+        buf.write("---\n\n")
     
-    def _generate_by_priority_section(self, action_items: List[ActionItem]) -> str:
+    def _generate_by_priority_section(
+        self,
+        buf: io.StringIO,
+        by_priority: Dict[str, List[ActionItem]],
+        display_assignee: Dict[Optional[str], str]
+    ) -> None:
         """Generate action items grouped by priority"""
-        section = ["## 🎯 Action Items by Priority\n"]
-        
-        # Group by priority
-        by_priority = {
-            'high': [i for i in action_items if i.priority == 'high'],
-            'medium': [i for i in action_items if i.priority == 'medium'],
-            'low': [i for i in action_items if i.priority == 'low']
-        }
+        buf.write("## 🎯 Action Items by Priority\n\n")
         
         for priority in ['high', 'medium', 'low']:
             items = by_priority[priority]
@@ -222,94 +265,88 @@ class SummaryGenerator:
                 continue
             
             emoji = self.priority_emojis[priority]
-            section.append(f"### {emoji} {priority.capitalize()} Priority ({len(items)} items)\n")
+            buf.write(f"### {emoji} {priority.capitalize()} Priority ({len(items)} items)\n\n")
             
             for item in items:
-                assignee = f"@{item.assignee}" if item.assignee else "*Unassigned*"
+                assignee = display_assignee[item.assignee]
                 deadline = f" - 📅 {item.deadline}" if item.deadline else ""
-                section.append(f"- {item.task} ({assignee}){deadline}")
+                buf.write(f"- {item.task} ({assignee}){deadline}\n")
             
-            section.append("")
+            buf.write("\n")
         
-        section.append("---\n")
-        return "\n".join(section)
+        buf.write("---\n\n")
     
-    def _generate_deadlines_section(self, action_items: List[ActionItem]) -> str:
+    def _generate_deadlines_section(
+        self,
+        buf: io.StringIO,
+        items_with_deadlines: List[ActionItem],
+        display_assignee: Dict[Optional[str], str]
+    ) -> None:
         """Generate upcoming deadlines section"""
-        section = ["## 📅 Upcoming Deadlines\n"]
-        
-        # Filter items with deadlines
-        items_with_deadlines = [i for i in action_items if i.deadline]
+        buf.write("## 📅 Upcoming Deadlines\n\n")
         
         if not items_with_deadlines:
-            section.append("*No deadlines specified.*\n")
-            return "\n".join(section)
+            buf.write("*No deadlines specified.*\n\n")
+            return
         
-        # Sort by deadline
+        # Sort by deadline, reading the clock once for the whole sort
+        now = datetime.now()
         try:
             sorted_items = sorted(
                 items_with_deadlines,
-                key=lambda x: self._parse_deadline_for_sort(x.deadline)
+                key=lambda x: self._parse_deadline_for_sort(x.deadline, now)
             )
         except:
             sorted_items = items_with_deadlines
         
         for item in sorted_items:
             priority_emoji = self.priority_emojis.get(item.priority, '⚪')
-            assignee = f"@{item.assignee}" if item.assignee else "*Unassigned*"
-            section.append(f"- **{item.deadline}** {priority_emoji} - {item.task} ({assignee})")
+            assignee = display_assignee[item.assignee]
+            buf.write(f"- **{item.deadline}** {priority_emoji} - {item.task} ({assignee})\n")
         
-        section.append("\n---\n")
-        return "\n".join(section)
+        buf.write("\n---\n\n")
     
-    def _generate_next_steps_section(self, action_items: List[ActionItem]) -> str:
+    def _generate_next_steps_section(self, buf: io.StringIO, groups: Dict) -> None:
         """Generate next steps section"""
-        section = ["## 🚀 Next Steps\n"]
+        buf.write("## 🚀 Next Steps\n\n")
         
-        if not action_items:
-            section.append("*No immediate next steps identified.*\n")
-            return "\n".join(section)
+        display_assignee = groups['display_assignee']
         
         # Get high priority items
-        high_priority = [i for i in action_items if i.priority == 'high']
+        high_priority = groups['by_priority']['high']
         
         if high_priority:
-            section.append("**Immediate Actions (High Priority):**\n")
+            buf.write("**Immediate Actions (High Priority):**\n\n")
             for item in high_priority[:5]:  # Top 5
-                assignee = f"@{item.assignee}" if item.assignee else "*Unassigned*"
-                section.append(f"1. {assignee} - {item.task}")
-            section.append("")
+                assignee = display_assignee[item.assignee]
+                buf.write(f"1. {assignee} - {item.task}\n")
+            buf.write("\n")
         
         # Get items with near deadlines
-        urgent_deadlines = [
-            i for i in action_items 
-            if i.deadline and any(x in i.deadline.upper() for x in ['ASAP', 'TODAY', 'TOMORROW', 'EOD'])
-        ]
+        urgent_deadlines = [i for i in groups['with_deadline'] if self._URGENT_RE.search(i.deadline)]
         
         if urgent_deadlines:
-            section.append("**Urgent Deadlines:**\n")
+            buf.write("**Urgent Deadlines:**\n\n")
             for item in urgent_deadlines:
-                assignee = f"@{item.assignee}" if item.assignee else "*Unassigned*"
-                section.append(f"- {assignee} - {item.task} (Due: {item.deadline})")
-            section.append("")
-        
-        section.append("**General Recommendations:**")
-        section.append("- Review and assign unassigned action items")
-        section.append("- Set deadlines for items without due dates")
-        section.append("- Schedule follow-up meeting if needed")
-        section.append("")
-        
-        return "\n".join(section)
+                assignee = display_assignee[item.assignee]
+                buf.write(f"- {assignee} - {item.task} (Due: {item.deadline})\n")
+            buf.write("\n")
+        
+        buf.write("**General Recommendations:**\n")
+        buf.write("- Review and assign unassigned action items\n")
+        buf.write("- Set deadlines for items without due dates\n")
+        buf.write("- Schedule follow-up meeting if needed\n")
+        buf.write("\n")
     
-    def _parse_deadline_for_sort(self, deadline: str) -> datetime:
+    def _parse_deadline_for_sort(self, deadline: str, now: Optional[datetime] = None) -> datetime:
         """Parse deadline string for sorting"""
+        if now is None:
+            now = datetime.now()
+        
         # Handle special cases
-        if 'ASAP' in deadline.upper():
-            return datetime.now()
-        if 'TODAY' in deadline.upper():
-            return datetime.now()
-        if 'TOMORROW' in deadline.upper():
-            return datetime.now()
+        deadline_upper = deadline.upper()
+        if 'ASAP' in deadline_upper or 'TODAY' in deadline_upper or 'TOMORROW' in deadline_upper:
+            return now
         
         # Try to parse ISO date
         try:
@@ -323,7 +360,8 @@ class SummaryGenerator:
         action_items: List[ActionItem],
         meeting_title: str = "Meeting",
         meeting_date: Optional[str] = None,
-        include_stats: bool = True
+        include_stats: bool = True,
+        statistics: Optional[Dict] = None
     ) -> str:
         """
         Generate JSON output for API integration
@@ -333,56 +371,89 @@ class SummaryGenerator:
             meeting_title: Title of the meeting
             meeting_date: Date of the meeting
             include_stats: Include statistics
+            statistics: Precomputed statistics dict (see generate_both)
             
         Returns:
             JSON string
         """
+        now = datetime.now()
         if meeting_date is None:
-            meeting_date = datetime.now().strftime('%Y-%m-%d')
+            meeting_date = now.strftime('%Y-%m-%d')
         
         output = {
             'meeting': {
                 'title': meeting_title,
                 'date': meeting_date,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': now.isoformat()
             },
             'action_items': [item.to_dict() for item in action_items]
         }
         
         if include_stats:
-            output['statistics'] = self._generate_statistics_dict(action_items)
+            output['statistics'] = statistics or self._generate_statistics_dict(action_items)
         
-        return json.dumps(output, indent=2, ensure_ascii=False)
+        return _dumps_json(output)
     
-    def _generate_statistics_dict(self, action_items: List[ActionItem]) -> Dict:
-        """Generate statistics as dictionary"""
-        total = len(action_items)
+    def generate_both(
+        self,
+        action_items: List[ActionItem],
+        meeting_title: str = "Meeting",
+        meeting_date: Optional[str] = None,
+        include_stats: bool = True,
+        include_context: bool = False
+    ) -> Tuple[str, str]:
+        """
+        Generate the Markdown and JSON summaries together
         
-        # By assignee
-        by_assignee = defaultdict(int)
-        for item in action_items:
-            assignee = item.assignee if item.assignee else "Unassigned"
-            by_assignee[assignee] += 1
-        
-        # By priority
-        by_priority = {
-            'high': len([i for i in action_items if i.priority == 'high']),
-            'medium': len([i for i in action_items if i.priority == 'medium']),
-            'low': len([i for i in action_items if i.priority == 'low'])
-        }
+        The statistics both formats report are computed once and shared.
+        
+        Args:
+            action_items: List of ActionItem objects
+            meeting_title: Title of the meeting
+            meeting_date: Date of the meeting (each format defaults to today)
+            include_stats: Include statistics in both outputs
+            include_context: Include context in the Markdown output
+            
+        Returns:
+            (markdown, json) strings
+        """
+        statistics = self._generate_statistics_dict(action_items) if include_stats else None
+        
+        markdown = self.generate_markdown(
+            action_items,
+            meeting_title=meeting_title,
+            meeting_date=meeting_date,
+            include_stats=include_stats,
+            include_context=include_context,
+            statistics=statistics
+        )
+        json_str = self.generate_json(
+            action_items,
+            meeting_title=meeting_title,
+            meeting_date=meeting_date,
+            include_stats=include_stats,
+            statistics=statistics
+        )
+        return markdown, json_str
+    
+    def _generate_statistics_dict(self, action_items: List[ActionItem], groups: Optional[Dict] = None) -> Dict:
+        """Generate statistics as dictionary (from _group_items groups when given)"""
+        if groups is None:
+            groups = self._group_items(action_items)
         
-        # Deadlines
-        with_deadline = len([i for i in action_items if i.deadline])
+        total = len(action_items)
+        with_deadline = len(groups['with_deadline'])
+        assigned = groups['assigned']
         
         return {
             'total_items': total,
-            'assigned': len([i for i in action_items if i.assignee]),
-            'unassigned': len([i for i in action_items if not i.assignee]),
+            'assigned': assigned,
+            'unassigned': total - assigned,
             'with_deadline': with_deadline,
             'without_deadline': total - with_deadline,
-            'by_assignee': dict(by_assignee),
-            'by_priority': by_priority,
-            'unique_assignees': len(set(i.assignee for i in action_items if i.assignee))
+            'by_assignee': {name: len(items) for name, items in groups['by_assignee'].items()},
+            'by_priority': {p: len(items) for p, items in groups['by_priority'].items()},
+            'unique_assignees': len(groups['assignees'])
         }
     
     def save_to_file(
@@ -450,12 +521,22 @@ class SummaryGenerator:
             logger.error(f"Unexpected error saving file: {e}", exc_info=True)
             raise OutputError(f"Failed to save file: {str(e)}")
     
-    def generate_compact_summary(self, action_items: List[ActionItem]) -> str:
-        """Generate a compact one-line summary"""
+    def generate_compact_summary(self, action_items: List[ActionItem], groups: Optional[Dict] = None) -> str:
+        """Generate a compact one-line summary (from _group_items groups when given)"""
         total = len(action_items)
-        high = len([i for i in action_items if i.priority == 'high'])
-        assigned = len([i for i in action_items if i.assignee])
-        with_deadline = len([i for i in action_items if i.deadline])
+        if groups is not None:
+            high = len(groups['by_priority']['high'])
+            assigned = groups['assigned']
+            with_deadline = len(groups['with_deadline'])
+        else:
+            high = assigned = with_deadline = 0
+            for item in action_items:
+                if item.priority == 'high':
+                    high += 1
+                if item.assignee:
+                    assigned += 1
+                if item.deadline:
+                    with_deadline += 1
         
         return (
             f"📋 {total} action items | "
@@ -480,15 +561,14 @@ class SummaryGenerator:
             f"---\n"
         ]
         
+        # Bucket once for the compact summary and the per-assignee list
+        groups = self._group_items(action_items)
+        
         # Add compact summary
-        body.append(self.generate_compact_summary(action_items))
+        body.append(self.generate_compact_summary(action_items, groups))
         body.append("\n\nACTION ITEMS:\n")
         
-        # Group by assignee
-        by_assignee = defaultdict(list)
-        for item in action_items:
-            assignee = item.assignee if item.assignee else "Unassigned"
-            by_assignee[assignee].append(item)
+        by_assignee = groups['by_assignee']
         
         for assignee in sorted(by_assignee.keys()):
             items = by_assignee[assignee]
@@ -4,6 +4,8 @@
 import sys
 import logging
 import io
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.parser import TranscriptParser
 from src.action_detector import ActionDetector
@@ -24,90 +26,89 @@ if sys.platform == 'win32':
 logging.basicConfig(level=logging.WARNING)
 
 
-def test_transcript(file_path: str, expected_format: str):
-    """Test parsing a single transcript file"""
-    print(f"\n{'='*70}")
-    print(f"Testing: {file_path}")
-    print(f"Expected format: {expected_format}")
-    print('='*70)
+def test_transcript(file_path: str, expected_format: str, out=None):
+    """Test parsing a single transcript file, printing to out (stdout by default)"""
+    print(f"\n{'='*70}", file=out)
+    print(f"Testing: {file_path}", file=out)
+    print(f"Expected format: {expected_format}", file=out)
+    print('='*70, file=out)
     
     try:
         # Parse transcript
         parser = TranscriptParser()
         messages = parser.parse_file(file_path)
         
-        print(f"✅ Parsing successful!")
-        print(f"   Messages found: {len(messages)}")
+        print(f"✅ Parsing successful!", file=out)
+        print(f"   Messages found: {len(messages)}", file=out)
         
         # Get statistics
         stats = parser.get_format_stats(messages)
-        print(f"\n📊 Format Statistics:")
-        print(f"   Total messages: {stats['total_messages']}")
-        print(f"   With timestamps: {stats['with_timestamps']}")
-        print(f"   Without timestamps: {stats['without_timestamps']}")
-        print(f"   Unique speakers: {stats['unique_speakers']}")
-        print(f"   Unknown speakers: {stats['unknown_speakers']}")
+        print(f"\n📊 Format Statistics:", file=out)
+        print(f"   Total messages: {stats['total_messages']}", file=out)
+        print(f"   With timestamps: {stats['with_timestamps']}", file=out)
+        print(f"   Without timestamps: {stats['without_timestamps']}", file=out)
+        print(f"   Unique speakers: {stats['unique_speakers']}", file=out)
+        print(f"   Unknown speakers: {stats['unknown_speakers']}", file=out)
         
         # Show speakers
         speakers = parser.get_speakers(messages)
-        print(f"\n👥 Speakers detected: {', '.join(speakers)}")
+        print(f"\n👥 Speakers detected: {', '.join(speakers)}", file=out)
         
         # Show sample messages
-        print(f"\n📝 Sample messages:")
+        print(f"\n📝 Sample messages:", file=out)
         for i, msg in enumerate(messages[:3], 1):
             timestamp = f"[{msg['timestamp']}] " if msg['timestamp'] else ""
             text_preview = msg['text'][:60] + "..." if len(msg['text']) > 60 else msg['text']
-            print(f"   {i}. {timestamp}{msg['speaker']}: {text_preview}")
+            print(f"   {i}. {timestamp}{msg['speaker']}: {text_preview}", file=out)
         
         # Extract action items
-        print(f"\n🎯 Extracting action items...")
+        print(f"\n🎯 Extracting action items...", file=out)
         detector = ActionDetector()
         action_items = detector.extract_action_items(messages)
         
-        print(f"   Action items found: {len(action_items)}")
+        print(f"   Action items found: {len(action_items)}", file=out)
         
         if action_items:
             # Show action item statistics
             item_stats = detector.get_statistics(action_items)
-            print(f"\n📈 Action Item Statistics:")
-            print(f"   Total: {item_stats['total']}")
-            print(f"   High priority: {item_stats['by_priority']['high']}")
-            print(f"   Medium priority: {item_stats['by_priority']['medium']}")
-            print(f"   Low priority: {item_stats['by_priority']['low']}")
-            print(f"   With deadlines: {item_stats['with_deadline']}")
-            print(f"   Without deadlines: {item_stats['without_deadline']}")
+            print(f"\n📈 Action Item Statistics:", file=out)
+            print(f"   Total: {item_stats['total']}", file=out)
+            print(f"   High priority: {item_stats['by_priority']['high']}", file=out)
+            print(f"   Medium priority: {item_stats['by_priority']['medium']}", file=out)
+            print(f"   Low priority: {item_stats['by_priority']['low']}", file=out)
+            print(f"   With deadlines: {item_stats['with_deadline']}", file=out)
+            print(f"   Without deadlines: {item_stats['without_deadline']}", file=out)
             
-            print(f"\n   By assignee:")
+            print(f"\n   By assignee:", file=out)
             for assignee, count in sorted(item_stats['by_assignee'].items()):
-                print(f"      {assignee}: {count}")
+                print(f"      {assignee}: {count}", file=out)
             
             # Show sample action items
-            print(f"\n✅ Sample action items:")
+            print(f"\n✅ Sample action items:", file=out)
             for i, item in enumerate(action_items[:5], 1):
                 priority_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}.get(item.priority, '⚪')
                 assignee = f"@{item.assignee}" if item.assignee else "Unassigned"
                 deadline = f" (Due: {item.deadline})" if item.deadline else ""
                 task_preview = item.task[:70] + "..." if len(item.task) > 70 else item.task
-                print(f"   {i}. {priority_emoji} {task_preview}")
-                print(f"      Assignee: {assignee}{deadline}")
+                print(f"   {i}. {priority_emoji} {task_preview}", file=out)
+                print(f"      Assignee: {assignee}{deadline}", file=out)
             
             # Generate summary
-            print(f"\n📝 Generating summary...")
+            print(f"\n📝 Generating summary...", file=out)
             generator = SummaryGenerator()
             summary = generator.generate_compact_summary(action_items)
-            print(f"   {summary}")
+            print(f"   {summary}", file=out)
         
         return True
         
     except MeetingExtractorError as e:
-        print(f"❌ Error: {e.message}")
+        print(f"❌ Error: {e.message}", file=out)
         if e.suggestion:
-            print(f"💡 {e.suggestion}")
+            print(f"💡 {e.suggestion}", file=out)
         return False
     except Exception as e:
-        print(f"❌ Unexpected Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Unexpected Error: {e}", file=out)
+        traceback.print_exc(file=out)
         return False
 
 
@@ -123,15 +124,29 @@ def run_all_tests():
         ("sample_transcripts/plain_meeting.txt", "Plain text format"),
     ]
     
+    # Run the samples concurrently, buffering each test's output so it prints in order
+    jobs = []
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        for file_path, expected_format in test_cases:
+            if not Path(file_path).exists():
+                jobs.append(None)
+                continue
+            
+            buffer = io.StringIO()
+            future = executor.submit(test_transcript, file_path, expected_format, buffer)
+            jobs.append((future, buffer))
+    
     results = []
     
-    for file_path, expected_format in test_cases:
-        if not Path(file_path).exists():
+    for (file_path, expected_format), job in zip(test_cases, jobs):
+        if job is None:
             print(f"\n⚠️  Warning: {file_path} not found, skipping...")
             results.append(False)
             continue
         
-        success = test_transcript(file_path, expected_format)
+        future, buffer = job
+        success = future.result()
+        print(buffer.getvalue(), end='')
         results.append(success)
     
     # Summary
@@ -187,6 +202,44 @@ def test_error_handling():
     print("\n✅ Error handling tests completed")
 
 
+def test_keyword_detection():
+    """Test TODO/ASAP keywords and empty tasks"""
+    print(f"\n{'='*70}")
+    print("Testing Keyword Detection")
+    print('='*70)
+    
+    detector = ActionDetector()
+    
+    def extract(text):
+        return detector.extract_action_items([{'speaker': 'Bob', 'text': text, 'timestamp': None}])
+    
+    # Test TODO prefix
+    print("\n1. Testing TODO prefix...")
+    items = extract("TODO: update the API docs")
+    if len(items) == 1 and items[0].task == "update the API docs":
+        print(f"   ✅ Detected task: {items[0].task}")
+    else:
+        print(f"   ❌ Expected one 'update the API docs' task, got {[i.task for i in items]}")
+    
+    # Test bare TODO
+    print("\n2. Testing bare TODO...")
+    items = extract("TODO")
+    if not items:
+        print("   ✅ Correctly skipped empty task")
+    else:
+        print(f"   ❌ Should have skipped empty task, got {[i.task for i in items]}")
+    
+    # Test ASAP priority
+    print("\n3. Testing ASAP priority...")
+    items = extract("Bob will fix the login bug ASAP if possible")
+    if len(items) == 1 and items[0].priority == 'high':
+        print("   ✅ ASAP detected as high priority")
+    else:
+        print(f"   ❌ Expected high priority, got {[i.priority for i in items]}")
+    
+    print("\n✅ Keyword detection tests completed")
+
+
 if __name__ == '__main__':
     # Run main tests
     exit_code = run_all_tests()
@@ -194,6 +247,9 @@ if __name__ == '__main__':
     # Run error handling tests
     test_error_handling()
     
+    # Run keyword detection tests
+    test_keyword_detection()
+    
     print("\n" + "="*70)
     print("Testing complete!")
     print("="*70 + "\n")
@@ -3,6 +3,7 @@
 Simple runner script for the Indore Night Food Guide app
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -19,24 +20,38 @@ def main():
         return 1
     
     print("✅ Knowledge base found: .kiro/product.md")
+    
+    if importlib.util.find_spec("streamlit") is None:
+        print("❌ Error: Streamlit not found. Please install requirements:")
+        print("   pip install -r requirements.txt")
+        return 1
+    
     print("🚀 Launching Streamlit app...")
     print("\nOnce started, open: http://localhost:8501")
     print("Press Ctrl+C to stop the server")
     print("=" * 50)
     
-    try:
-        # Run the Streamlit app
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "src/app.py"], check=True)
-    except KeyboardInterrupt:
-        print("\n👋 App stopped by user")
+    command = [sys.executable, "-m", "streamlit", "run", "src/app.py"]
+    
+    # On Windows execvp spawns a new process and exits, so keep a child there
+    if os.name == 'nt':
+        try:
+            subprocess.run(command, check=True)
+        except KeyboardInterrupt:
+            print("\n👋 App stopped by user")
+            return 0
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Error running app: {e}")
+            return 1
         return 0
-    except subprocess.CalledProcessError as e:
+    
+    # Replace this process with Streamlit instead of waiting on a child
+    sys.stdout.flush()
+    try:
+        os.execvp(sys.executable, command)
+    except OSError as e:
         print(f"❌ Error running app: {e}")
         return 1
-    except FileNotFoundError:
-        print("❌ Error: Streamlit not found. Please install requirements:")
-        print("   pip install -r requirements.txt")
-        return 1
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
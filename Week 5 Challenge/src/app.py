@@ -1,206 +1,40 @@
 import streamlit as st
 import os
+import re
+from collections import Counter
 from pathlib import Path
 
-# Configure Streamlit page
-st.set_page_config(
-    page_title="Indore Night Food Guide",
-    page_icon="🌙",
-    layout="centered",
-    initial_sidebar_state="collapsed"
-)
+try:
+    import ahocorasick
+except ImportError:  # optional dependency
+    ahocorasick = None
 
 # Custom CSS for dark theme and chat styling
-st.markdown("""
-<style>
-    .stApp {
-        background-color: #1e1e1e;
-        color: #ffffff;
-    }
-    
-    .chat-message {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-        display: flex;
-        flex-direction: column;
-    }
-    
-    .user-message {
-        background-color: #2d3748;
-        margin-left: 2rem;
-        align-self: flex-end;
-    }
-    
-    .assistant-message {
-        background-color: #4a5568;
-        margin-right: 2rem;
-        align-self: flex-start;
-    }
-    
-    .message-header {
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-        color: #ffd700;
-    }
-    
-    .message-footer {
-        font-size: 0.8rem;
-        color: #a0aec0;
-        margin-top: 0.5rem;
-        font-style: italic;
-    }
-    
-    .stTextInput > div > div > input {
-        background-color: #2d3748;
-        color: #ffffff;
-        border: 1px solid #4a5568;
-        height: 3rem;
-    }
-    
-    .stTextInput > div > div > input::placeholder {
-        color: #ffffff !important;
-        opacity: 0.8 !important;
-    }
-    
-    .stTextInput label {
-        color: #ffffff !important;
-        font-weight: bold !important;
-    }
-    
-    .stButton > button {
-        background-color: #ffd700;
-        color: #1e1e1e;
-        border: none;
-        font-weight: bold;
-        height: 3rem;
-        margin-top: 0rem;
-        font-size: 0.85rem;
-        padding: 0.25rem 0.5rem;
-        vertical-align: top;
-    }
-    
-    .stButton > button:hover {
-        background-color: #ffed4e;
-        transform: translateY(-1px);
-    }
-    
-    .header-title {
-        text-align: center;
-        color: #ffd700;
-        font-size: 2.5rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .header-subtitle {
-        text-align: center;
-        color: #a0aec0;
-        font-size: 1.2rem;
-        margin-bottom: 1rem;
-    }
-    
-    .local-indicator {
-        text-align: center;
-        color: #ffd700;
-        font-size: 0.9rem;
-        margin-bottom: 2rem;
-        padding: 0.75rem;
-        background-color: #2d3748;
-        border-radius: 0.5rem;
-        border-left: 4px solid #ffd700;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .quick-ask-container {
-        margin: 1rem 0;
-        text-align: center;
-    }
-    
-    .quick-ask-button {
-        display: inline-block;
-        margin: 0.25rem;
-        padding: 0.5rem 1rem;
-        background-color: #4a5568;
-        color: #ffffff;
-        border: 1px solid #ffd700;
-        border-radius: 1.5rem;
-        cursor: pointer;
-        font-size: 0.9rem;
-        transition: all 0.2s ease;
-    }
-    
-    .quick-ask-button:hover {
-        background-color: #ffd700;
-        color: #1e1e1e;
-    }
-    
-    .welcome-section {
-        background-color: #2d3748;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        border-left: 3px solid #ffd700;
-    }
-    
-    .welcome-header {
-        color: #ffd700;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def load_product_knowledge():
-    """
-    Load the product.md file containing local knowledge about Indore's night food culture.
-    This file serves as the complete knowledge base for the AI assistant.
-    """
-    try:
-        # Path to the knowledge base file
-        knowledge_file = Path(".kiro/product.md")
-        
-        if knowledge_file.exists():
-            with open(knowledge_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content
-        else:
-            return "Knowledge file not found. Please ensure .kiro/product.md exists."
-    except Exception as e:
-        return f"Error loading knowledge file: {str(e)}"
-
-def generate_ai_response(user_question, context):
-    """
-    Generate AI response based on the user question and local context.
-    This simulates an AI response using the product.md content as the knowledge base.
-    
-    In a real implementation, this would call an LLM API (OpenAI, Anthropic, etc.)
-    with the context injected as system prompt.
-    """
-    
-    # Convert question to lowercase for better matching
-    question_lower = user_question.lower()
-    
-    # First check if question is about something not in our knowledge base
-    out_of_scope_words = ["mumbai", "delhi", "bangalore", "pizza", "burger", "chinese", "italian", "continental", "mcdonalds", "kfc", "dominos", "subway"]
-    if any(word in question_lower for word in out_of_scope_words):
-        return """I don't have this information in my local Indore food guide.
+CSS_FILE = Path(__file__).parent / "static" / "app.css"
+
+# Quick Ask buttons as (question, widget key)
+QUICK_ASKS = (
+    ("🍽 Best food at Sarafa after 11 PM", "quick1"),
+    ("🍰 Best dessert in Indore night food", "quick2"),
+    ("🌮 Sarafa vs Chappan Dukan", "quick3"),
+    ("🥗 Veg options available late night", "quick4"),
+)
 
-Try asking me about:
-• "What should I eat at Sarafa after 11 PM?"
-• "Difference between Sarafa and Chappan Dukan?"
-• "Best dessert in Indore night food?"
-• "Which snacks are iconic to Indore street food?"
+# Places and cuisines the local knowledge base does not cover
+OUT_OF_SCOPE_WORDS = frozenset([
+    "mumbai", "delhi", "bangalore", "pizza", "burger", "chinese", "italian",
+    "continental", "mcdonalds", "kfc", "dominos", "subway"
+])
 
-I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all the local specialties!
+# Splits a lowercased question into words for the out-of-scope check
+WORD_RE = re.compile(r"[a-z]+")
 
-— Source: Indore Night Food Guide (local context)"""
-    
-    # Define response patterns based on the knowledge base
-    responses = {
-        # Sarafa Bazaar related
-        "sarafa": {
-            "keywords": ["sarafa", "night market", "late night", "after 11", "midnight"],
-            "response": """🌙 **Sarafa Bazaar Night Market** is perfect for late-night food adventures!
+# Response patterns based on the knowledge base
+RESPONSES = {
+    # Sarafa Bazaar related
+    "sarafa": {
+        "keywords": ["sarafa", "night market", "late night", "after 11", "midnight"],
+        "response": """🌙 **Sarafa Bazaar Night Market** is perfect for late-night food adventures!
 
 **Timing**: Opens around 8-9 PM and stays active till 2-3 AM - perfect for your late-night cravings!
 
@@ -214,12 +48,12 @@ I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all
 **Sarafa Bazaar** transforms from a jewelry market by day to a bustling food street by evening, attracting thousands of people every night!
 
 — Source: Indore Night Food Guide (local context)"""
-        },
-        
-        # Chappan Dukan related
-        "chappan": {
-            "keywords": ["chappan", "56 dukan", "difference", "compare"],
-            "response": """🏪 **Chappan Dukan (56 Dukan)** vs **Sarafa Bazaar**:
+    },
+    
+    # Chappan Dukan related
+    "chappan": {
+        "keywords": ["chappan", "56 dukan", "difference", "compare"],
+        "response": """🏪 **Chappan Dukan (56 Dukan)** vs **Sarafa Bazaar**:
 
 **Chappan Dukan:**
 • 56 shops offering diverse snacks and specialties
@@ -236,12 +70,12 @@ I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all
 **Key Difference**: **Sarafa Bazaar** is better for late-night (after 11:30 PM) traditional food, while **Chappan Dukan** offers more variety but closes earlier!
 
 — Source: Indore Night Food Guide (local context)"""
-        },
-        
-        # Dessert related
-        "dessert": {
-            "keywords": ["dessert", "sweet", "jalebi", "kulfi", "faluda"],
-            "response": """🍯 **Best Desserts in Indore Night Food:**
+    },
+    
+    # Dessert related
+    "dessert": {
+        "keywords": ["dessert", "sweet", "jalebi", "kulfi", "faluda"],
+        "response": """🍯 **Best Desserts in Indore Night Food:**
 
 **Top Picks:**
 • **King-Size Jalebi** - Giant crispy jalebi soaked in sugar syrup (**Sarafa Bazaar** specialty!)
@@ -252,12 +86,12 @@ I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all
 **Pro Tip**: Head to **Sarafa Bazaar** for the most authentic dessert experience - they stay open till 2-3 AM, so you can satisfy those late-night sweet cravings!
 
 — Source: Indore Night Food Guide (local context)"""
-        },
-        
-        # General food recommendations
-        "food": {
-            "keywords": ["eat", "food", "try", "recommend", "best", "iconic"],
-            "response": """🍴 **Iconic Indore Night Food Must-Tries:**
+    },
+    
+    # General food recommendations
+    "food": {
+        "keywords": ["eat", "food", "try", "recommend", "best", "iconic"],
+        "response": """🍴 **Iconic Indore Night Food Must-Tries:**
 
 **Traditional Specials:**
 • **Bhutte ka Kees** - Grated corn with milk & spices (sweet + spicy!)
@@ -272,12 +106,12 @@ I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all
 Indore's street food blends Malwi, Rajasthani, Gujarati, and Maharashtrian influences - expect amazing spicy, sweet, tangy combinations!
 
 — Source: Indore Night Food Guide (local context)"""
-        },
-        
-        # Specific dishes
-        "bhutte": {
-            "keywords": ["bhutte", "kees", "corn"],
-            "response": """🌽 **Bhutte ka Kees** - A True Indore Specialty!
+    },
+    
+    # Specific dishes
+    "bhutte": {
+        "keywords": ["bhutte", "kees", "corn"],
+        "response": """🌽 **Bhutte ka Kees** - A True Indore Specialty!
 
 **What it is:**
 • Grated corn cooked with milk, spices, and local condiments
@@ -291,12 +125,12 @@ Indore's street food blends Malwi, Rajasthani, Gujarati, and Maharashtrian influ
 This is one of Indore's most iconic traditional dishes - a must-try for anyone exploring the local night food scene!
 
 — Source: Indore Night Food Guide (local context)"""
-        },
-        
-        # Veg options
-        "veg": {
-            "keywords": ["veg", "vegetarian", "veggie", "vegan"],
-            "response": """🥗 **Vegetarian Options Available Late Night:**
+    },
+    
+    # Veg options
+    "veg": {
+        "keywords": ["veg", "vegetarian", "veggie", "vegan"],
+        "response": """🥗 **Vegetarian Options Available Late Night:**
 
 **Sarafa Bazaar** (till 2-3 AM):
 • **Bhutte ka Kees** - Grated corn with milk and spices
@@ -313,23 +147,24 @@ This is one of Indore's most iconic traditional dishes - a must-try for anyone e
 Most of Indore's street food is naturally vegetarian, reflecting the local food culture!
 
 — Source: Indore Night Food Guide (local context)"""
-        }
     }
-    
-    # Find the best matching response
-    best_match = None
-    max_matches = 0
-    
-    for category, data in responses.items():
-        matches = sum(1 for keyword in data["keywords"] if keyword in question_lower)
-        if matches > max_matches:
-            max_matches = matches
-            best_match = data["response"]
-    
-    # If no specific match found, provide general guidance
-    if not best_match or max_matches == 0:
-        # General welcome response
-        best_match = """🌙 **Welcome to Indore Night Food Guide!**
+}
+
+# Reply for questions outside the local knowledge base
+OUT_OF_SCOPE_RESPONSE = """I don't have this information in my local Indore food guide.
+
+Try asking me about:
+• "What should I eat at Sarafa after 11 PM?"
+• "Difference between Sarafa and Chappan Dukan?"
+• "Best dessert in Indore night food?"
+• "Which snacks are iconic to Indore street food?"
+
+I have detailed information about **Sarafa Bazaar**, **Chappan Dukan**, and all the local specialties!
+
+— Source: Indore Night Food Guide (local context)"""
+
+# General guidance when no keywords match
+WELCOME_RESPONSE = """🌙 **Welcome to Indore Night Food Guide!**
 
 I'm your local AI food assistant, here to help you explore Indore's amazing night street food culture!
 
@@ -346,6 +181,151 @@ I'm your local AI food assistant, here to help you explore Indore's amazing nigh
 Ask me anything about Indore's night food scene!
 
 — Source: Indore Night Food Guide (local context)"""
+
+# Configure Streamlit page
+st.set_page_config(
+    page_title="Indore Night Food Guide",
+    page_icon="🌙",
+    layout="centered",
+    initial_sidebar_state="collapsed"
+)
+
+@st.cache_data(show_spinner=False)
+def load_custom_css():
+    """
+    Read the app stylesheet once per process instead of on every rerun.
+    """
+    return CSS_FILE.read_text(encoding='utf-8')
+
+# Apply the dark theme and chat styling
+st.markdown(f"<style>\n{load_custom_css()}</style>", unsafe_allow_html=True)
+
+def map_keyword_categories():
+    """
+    Map each keyword to the (keyword, categories) entry it counts towards.
+    """
+    keyword_categories = {}
+    for category, data in RESPONSES.items():
+        for keyword in data["keywords"]:
+            keyword_categories.setdefault(keyword, []).append(category)
+    return {keyword: (keyword, tuple(categories)) for keyword, categories in keyword_categories.items()}
+
+@st.cache_resource(show_spinner=False)
+def build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over every category keyword.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, entry in map_keyword_categories().items():
+        automaton.add_word(keyword, entry)
+    automaton.make_automaton()
+    return automaton
+
+@st.cache_resource(show_spinner=False)
+def build_keyword_regex():
+    """
+    Build a single regex that finds the longest keyword starting at each position.
+    Every shorter keyword found at that position is a prefix of it, so each
+    keyword maps to the entries of all its keyword prefixes.
+    """
+    entries = map_keyword_categories()
+    keywords = sorted(entries, key=len, reverse=True)
+    
+    # Zero-width lookahead so overlapping keywords are all visited
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    prefixes = {
+        keyword: [entries[other] for other in keywords if keyword.startswith(other)]
+        for keyword in keywords
+    }
+    return pattern, prefixes
+
+def count_keyword_matches(question_lower):
+    """
+    Count how many distinct keywords of each category appear in the question.
+    Uses a single Aho-Corasick pass when available, one regex scan otherwise.
+    """
+    automaton = build_keyword_automaton()
+    if automaton is not None:
+        found = {entry for _, entry in automaton.iter(question_lower)}
+    else:
+        pattern, prefixes = build_keyword_regex()
+        found = set()
+        for match in pattern.finditer(question_lower):
+            found.update(prefixes[match.group(1)])
+    
+    # A keyword can occur several times but only counts once per category
+    counts = Counter()
+    for _, categories in found:
+        counts.update(categories)
+    return counts
+
+@st.cache_data(show_spinner=False)
+def load_product_knowledge():
+    """
+    Load the product.md file containing local knowledge about Indore's night food culture.
+    This file serves as the complete knowledge base for the AI assistant.
+    The content is cached so it is read once per process, not on every rerun.
+    """
+    try:
+        # Path to the knowledge base file
+        knowledge_file = Path(".kiro/product.md")
+        
+        if knowledge_file.exists():
+            with open(knowledge_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            return content
+        else:
+            return "Knowledge file not found. Please ensure .kiro/product.md exists."
+    except Exception as e:
+        return f"Error loading knowledge file: {str(e)}"
+
+def normalize_question(user_question):
+    """
+    Lowercase the question and collapse runs of whitespace for matching.
+    """
+    return " ".join(user_question.lower().split())
+
+def generate_ai_response(user_question, context):
+    """
+    Generate AI response based on the user question and local context.
+    This simulates an AI response using the product.md content as the knowledge base.
+    
+    In a real implementation, this would call an LLM API (OpenAI, Anthropic, etc.)
+    with the context injected as system prompt.
+    """
+    # The answer only depends on the question, so repeated asks hit the cache
+    return match_response(normalize_question(user_question))
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def match_response(question_lower):
+    """
+    Pick the canned response whose keywords best match a normalized question.
+    """
+    
+    # First check if question is about something not in our knowledge base
+    # (whole words only, so e.g. "subways" or "pizzahut" do not trip it)
+    if not OUT_OF_SCOPE_WORDS.isdisjoint(WORD_RE.findall(question_lower)):
+        return OUT_OF_SCOPE_RESPONSE
+    
+    # Find the best matching response
+    best_match = None
+    max_matches = 0
+    
+    keyword_matches = count_keyword_matches(question_lower)
+    for category, data in RESPONSES.items():
+        matches = keyword_matches.get(category, 0)
+        if matches > max_matches:
+            max_matches = matches
+            best_match = data["response"]
+    
+    # If no specific match found, provide general guidance
+    if not best_match or max_matches == 0:
+        # General welcome response
+        best_match = WELCOME_RESPONSE
     
     return best_match
 
@@ -375,9 +355,36 @@ def main():
         welcome_msg = generate_ai_response("welcome", context)
         st.session_state.messages.append({"role": "assistant", "content": welcome_msg})
     
+    # Chat input - pinned to the bottom of the page wherever it is declared
+    user_input = st.chat_input("Ask me about Indore's night food...")
+    
+    # Process user input before anything reads the history, so no rerun is needed
+    if user_input:
+        # Add user message to chat history
+        st.session_state.messages.append({"role": "user", "content": user_input})
+        
+        # Generate AI response using the context from product.md
+        ai_response = generate_ai_response(user_input, context)
+        
+        # Add AI response to chat history
+        st.session_state.messages.append({"role": "assistant", "content": ai_response})
+    
+    # Keep the welcome area above the Quick Ask buttons, filled in once they are handled
+    welcome_slot = st.container()
+    
+    # Quick Ask buttons using Streamlit columns - improves demo flow and judge clarity
+    st.markdown('<h3 style="color: #ffd700; margin-bottom: 1rem;">💬 Quick Ask</h3>', unsafe_allow_html=True)
+    
+    for (label, key), col in zip(QUICK_ASKS, st.columns(len(QUICK_ASKS))):
+        if col.button(label, key=key):
+            # Answer straight away; the history is rendered further down this run
+            st.session_state.messages.append({"role": "user", "content": label})
+            ai_response = generate_ai_response(label, context)
+            st.session_state.messages.append({"role": "assistant", "content": ai_response})
+    
     # Display welcome sections in a cleaner format
     if len(st.session_state.messages) == 1:
-        with st.expander("📖 Welcome & Getting Started", expanded=True):
+        with welcome_slot.expander("📖 Welcome & Getting Started", expanded=True):
             col1, col2 = st.columns(2)
             
             with col1:
@@ -414,87 +421,11 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
     
-    # Quick Ask buttons using Streamlit columns - improves demo flow and judge clarity
-    st.markdown('<h3 style="color: #ffd700; margin-bottom: 1rem;">💬 Quick Ask</h3>', unsafe_allow_html=True)
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("🍽 Best food at Sarafa after 11 PM", key="quick1"):
-            st.session_state.quick_query = "🍽 Best food at Sarafa after 11 PM"
-    
-    with col2:
-        if st.button("🍰 Best dessert in Indore night food", key="quick2"):
-            st.session_state.quick_query = "🍰 Best dessert in Indore night food"
-    
-    with col3:
-        if st.button("🌮 Sarafa vs Chappan Dukan", key="quick3"):
-            st.session_state.quick_query = "🌮 Sarafa vs Chappan Dukan"
-    
-    with col4:
-        if st.button("🥗 Veg options available late night", key="quick4"):
-            st.session_state.quick_query = "🥗 Veg options available late night"
-    
-    # Process quick query if set
-    if "quick_query" in st.session_state:
-        query = st.session_state.quick_query
-        del st.session_state.quick_query
-        
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": query})
-        
-        # Generate AI response using the context from product.md
-        ai_response = generate_ai_response(query, context)
-        
-        # Add AI response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-        
-        # Rerun to update the chat display
-        st.rerun()
-    
     # Display chat messages
     for message in st.session_state.messages:
-        if message["role"] == "user":
-            st.markdown(f"""
-            <div class="chat-message user-message">
-                <div class="message-header">You:</div>
-                <div>{message["content"]}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="chat-message assistant-message">
-                <div class="message-header">🌙 Food Guide:</div>
-                <div>{message["content"]}</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Chat input
-    col1, col2 = st.columns([4, 1])
-    
-    with col1:
-        user_input = st.text_input(
-            "",
-            placeholder="Ask me about Indore's night food...",
-            key="user_input",
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        send_button = st.button("Send", key="send_button")
-    
-    # Process user input
-    if send_button and user_input:
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        
-        # Generate AI response using the context from product.md
-        ai_response = generate_ai_response(user_input, context)
-        
-        # Add AI response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-        
-        # Rerun to update the chat display
-        st.rerun()
+        avatar = "🌙" if message["role"] == "assistant" else None
+        with st.chat_message(message["role"], avatar=avatar):
+            st.markdown(message["content"])
     
     # Footer
     st.markdown("---")